@@ -0,0 +1,32 @@
+"""
+Example: Daily gridded data
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from datetime import datetime
+import numpy as np
+import matplotlib.pyplot as plt
+from meteostat import Grid, Daily
+
+# Set time period
+start = datetime(2018, 1, 1)
+end = datetime(2018, 1, 31)
+
+# Create a grid around Frankfurt, Germany
+grid = Grid(np.arange(49.5, 50.5, 0.05), np.arange(8, 9.5, 0.05), 150)
+
+# Get weather stations used by the grid
+stations = grid.get_stations("daily", start, end)
+
+# Get daily data & interpolate onto the grid
+data = Daily(stations, start, end)
+fields = grid.interpolate(data)
+
+# Plot average temperature of the first day
+plt.imshow(fields["tavg"][0], origin="lower")
+plt.show()
@@ -18,6 +18,7 @@ from .interface.base import Base
 from .interface.timeseries import TimeSeries
 from .interface.stations import Stations
 from .interface.point import Point
+from .interface.grid import Grid
 from .interface.hourly import Hourly
 from .interface.daily import Daily
 from .interface.monthly import Monthly
@@ -24,6 +24,23 @@ def get_local_file_path(cache_dir: str, cache_subdir: str, path: str) -> str:
     return f"{cache_dir}/{cache_subdir}/{file}"
 
 
+def get_missing_file_path(path: str) -> str:
+    """
+    Get the local path of a missing file marker
+    """
+
+    return f"{path}.missing"
+
+
+def mark_missing(path: str) -> None:
+    """
+    Remember that a remote file does not exist
+    """
+
+    with open(get_missing_file_path(path), "w", encoding="utf-8"):
+        pass
+
+
 def file_in_cache(path: str, max_age: int = 0) -> bool:
     """
     Check if a file exists in the local cache
@@ -67,7 +84,14 @@ def clear_cache(cls, max_age: int = None) -> None:
             # Get full path
             path = os.path.join(cls.cache_dir + os.sep + cls.cache_subdir, file)
 
+            # Missing file markers expire earlier
+            age = (
+                min(max_age, cls.missing_max_age)
+                if path.endswith(".missing")
+                else max_age
+            )
+
             # Check if file is older than max_age
-            if now - os.path.getmtime(path) > max_age and os.path.isfile(path):
+            if now - os.path.getmtime(path) > age and os.path.isfile(path):
                 # Delete file
                 os.remove(path)
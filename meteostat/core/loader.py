@@ -8,11 +8,15 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
+from collections import deque
+from itertools import islice
+from queue import SimpleQueue
 from urllib.error import HTTPError
 from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
-from typing import Callable, Union
+from typing import Callable, Iterator, Union
 import pandas as pd
+from meteostat.core.cache import mark_missing
 from meteostat.core.warn import warn
 
 
@@ -61,7 +65,77 @@ def processing_handler(
     # Remove empty DataFrames
     filtered = list(filter(lambda df: df.index.size > 0, output))
 
-    return pd.concat(filtered) if len(filtered) > 0 else output[0]
+    if len(filtered) == 0:
+        return output[0]
+
+    df = pd.concat(filtered)
+
+    # Ensure a sorted index
+    return df if df.index.is_monotonic_increasing else df.sort_index()
+
+
+def processing_iterator(
+    datasets: list,
+    load: Callable[[dict], None],
+    cores: int,
+    threads: int,
+    ordered: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """
+    Load multiple datasets (simultaneously) and yield
+    non-empty DataFrames as they finish loading
+    """
+
+    # Single-thread processing
+    if (cores <= 1 and threads <= 1) or len(datasets) <= 1:
+
+        for dataset in datasets:
+            df = load(*dataset)
+            if df.index.size > 0:
+                yield df
+
+        return
+
+    # Number of datasets which are loaded in advance
+    ahead = 2 * (cores if cores > 1 else threads)
+
+    # Create process or thread pool
+    with Pool(cores) if cores > 1 else ThreadPool(threads) as pool:
+
+        queued = iter(datasets)
+        pending = deque()
+        finished = SimpleQueue()
+
+        while True:
+
+            # Keep a limited number of datasets in progress
+            for dataset in islice(queued, ahead - len(pending)):
+                if ordered:
+                    pending.append(pool.apply_async(load, dataset))
+                else:
+                    pending.append(
+                        pool.apply_async(
+                            load,
+                            dataset,
+                            callback=finished.put,
+                            error_callback=finished.put,
+                        )
+                    )
+
+            if not pending:
+                break
+
+            # Wait for the next (or first finished) dataset
+            if ordered:
+                df = pending.popleft().get()
+            else:
+                pending.pop()
+                df = finished.get()
+                if isinstance(df, Exception):
+                    raise df
+
+            if df.index.size > 0:
+                yield df
 
 
 def load_handler(
@@ -70,10 +144,16 @@ def load_handler(
     columns: list,
     types: Union[dict, None],
     parse_dates: list,
+    *,
     coerce_dates: bool = False,
+    usecols: Union[list, None] = None,
+    missing_path: Union[str, None] = None,
 ) -> pd.DataFrame:
     """
     Load a single CSV file into a DataFrame
+
+    If the file does not exist, a missing file marker
+    is created for missing_path (if provided)
     """
 
     try:
@@ -83,6 +163,7 @@ def load_handler(
             endpoint + path,
             compression="gzip",
             names=columns,
+            usecols=usecols,
             dtype=types,
             parse_dates=parse_dates,
         )
@@ -93,7 +174,11 @@ def load_handler(
                 pd.to_datetime, errors="coerce"
             )
 
-    except (FileNotFoundError, HTTPError):
+    except (FileNotFoundError, HTTPError) as error:
+
+        # Remember missing files (other errors may be temporary)
+        if missing_path and (isinstance(error, FileNotFoundError) or error.code == 404):
+            mark_missing(missing_path)
 
         # Create empty DataFrane
         df = pd.DataFrame(columns=[*types])
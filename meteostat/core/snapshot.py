@@ -0,0 +1,137 @@
+"""
+Core Class - Binary Snapshots
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import json
+from typing import Union
+import numpy as np
+import pandas as pd
+
+# File signature
+MAGIC = b"MSSNAP01"
+
+# Alignment of arrays in bytes
+ALIGNMENT = 8
+
+
+def _encode(series: pd.Series, decimals: Union[int, None] = None) -> tuple:
+    """
+    Encode a column as a typed array & its specification
+    """
+
+    spec = {"name": series.name, "dtype": str(series.dtype), "decimals": decimals}
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        spec["kind"] = "datetime"
+        values = series.to_numpy("datetime64[ns]").view("int64")
+
+    elif pd.api.types.is_float_dtype(series):
+        spec["kind"] = "float"
+        values = series.to_numpy(dtype="float32")
+
+    else:
+        # Store text as categorical codes
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, categories = pd.factorize(series)
+        spec["kind"] = "category"
+        spec["categories"] = [str(value) for value in categories]
+        values = codes.astype("int32")
+
+    spec["type"] = values.dtype.str
+
+    return values, spec
+
+
+def _decode(buffer: np.ndarray, spec: dict):
+    """
+    Restore a column from the snapshot buffer
+    """
+
+    values = buffer[spec["offset"] : spec["offset"] + spec["size"]].view(spec["type"])
+
+    if spec["kind"] == "datetime":
+        return values.view("datetime64[ns]")
+
+    if spec["kind"] == "float":
+        values = values.astype(spec["dtype"])
+        # Remove float32 rounding errors
+        if spec["decimals"] is not None:
+            values = np.round(values, spec["decimals"])
+        return values
+
+    if spec["dtype"] == "category":
+        return pd.Categorical.from_codes(values, spec["categories"])
+
+    # Restore text columns
+    categories = np.array(spec["categories"] + [None], dtype=object)
+
+    return pd.array(categories[values], dtype=spec["dtype"])
+
+
+def save_snapshot(df: pd.DataFrame, path: str, decimals: dict = None) -> None:
+    """
+    Save a DataFrame as a compact binary snapshot
+    """
+
+    if decimals is None:
+        decimals = {}
+
+    header = {"rows": len(df.index), "columns": []}
+    arrays = []
+    offset = 0
+
+    # Index & columns
+    series = [df.index.to_series(), *(df[col] for col in df.columns)]
+
+    for item in series:
+        values, spec = _encode(item, decimals.get(item.name))
+        spec["offset"] = offset
+        spec["size"] = values.nbytes
+        header["columns"].append(spec)
+        arrays.append(values)
+        offset += -(-values.nbytes // ALIGNMENT) * ALIGNMENT
+
+    # Encode header
+    header = json.dumps(header).encode("utf-8")
+    header += b" " * (-len(header) % ALIGNMENT)
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(np.uint64(len(header)).tobytes())
+        file.write(header)
+        for values in arrays:
+            file.write(values.tobytes())
+            file.write(b"\0" * (-values.nbytes % ALIGNMENT))
+
+
+def load_snapshot(path: str) -> pd.DataFrame:
+    """
+    Load a DataFrame from a (memory-mapped) binary snapshot
+    """
+
+    buffer = np.memmap(path, dtype="uint8", mode="r")
+
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"Invalid snapshot file {path}")
+
+    # Read header
+    start = len(MAGIC) + 8
+    length = int(buffer[len(MAGIC) : start].view("uint64")[0])
+    header = json.loads(bytes(buffer[start : start + length]).decode("utf-8"))
+
+    # Data section
+    buffer = buffer[start + length :]
+    index, *columns = header["columns"]
+
+    return pd.DataFrame(
+        {spec["name"]: _decode(buffer, spec) for spec in columns},
+        index=pd.Index(_decode(buffer, index), name=index["name"]),
+    )
@@ -29,8 +29,20 @@ class Base:
     # Maximum age of a cached file in seconds
     max_age: int = 24 * 60 * 60
 
+    # Maximum age of a cached missing file marker in seconds
+    missing_max_age: int = 60 * 60
+
     # Number of processes used for processing files
     processes: int = 1
 
     # Number of threads used for processing files
     threads: int = 1
+
+    # Use compact data types (float32, small integers & categorical stations)?
+    compact: bool = False
+
+    # Store mostly empty columns as sparse arrays?
+    sparse: bool = False
+
+    # Maximum share of non-empty values in sparse columns
+    sparse_density: float = 0.1
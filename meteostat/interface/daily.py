@@ -92,10 +92,23 @@ class Daily(TimeSeries):
         end: datetime = None,
         model: bool = True,  # Include model data?
         flags: bool = False,  # Load source flags?
+        *,
+        id_type: str = "id",  # Type of station identifiers (id, wmo or icao)
+        lazy: bool = False,  # Defer loading & processing until fetch()
+        parameters: list = None,  # Load selected parameters only
     ) -> None:
 
         # Initialize time series
-        self._init_time_series(loc, start, end, model, flags)
+        self._init_time_series(
+            loc,
+            start,
+            end,
+            model,
+            flags,
+            id_type=id_type,
+            lazy=lazy,
+            parameters=parameters,
+        )
 
     def expected_rows(self) -> int:
         """
@@ -0,0 +1,349 @@
+"""
+Grid Class
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from datetime import datetime
+from typing import Union
+import numpy as np
+import pandas as pd
+from meteostat.interface.stations import Stations
+from meteostat.interface.meteodata import MeteoData
+from meteostat.utilities.helpers import get_distance
+from meteostat.utilities.mutations import (
+    LAPSE_RATES,
+    get_lapse_rates,
+    reduce_pres,
+)
+
+
+class Grid:
+
+    """
+    Interpolate weather station data onto a regular
+    grid of geographical points
+    """
+
+    # Maximum radius for nearby stations
+    radius: int = 35000
+
+    # Maximum difference in altitude
+    alt_range: int = 350
+
+    # Maximum number of stations per cell
+    max_count: int = 4
+
+    # Adapt temperature data based on altitude
+    adapt_temp: bool = True
+
+    # Power parameter of the inverse distance weighting
+    power: float = 2
+
+    # Temperature difference by 100 meters per parameter (None = default)
+    lapse_rates: dict = None
+
+    # Reduce sea-level pressure to the altitude of each cell
+    adapt_pres: bool = False
+
+    # Number of cells processed at once when calculating weights
+    _chunk_size: int = 1024
+
+    # The latitudes
+    _lat: np.ndarray = None
+
+    # The longitudes
+    _lon: np.ndarray = None
+
+    # The altitude of each cell
+    _alt: Union[np.ndarray, None] = None
+
+    # The list of weather stations
+    _stations: pd.Index = None
+
+    # Station position, weight & altitude difference in 100 meters
+    # for each cell & slot (cells x max_count)
+    _weights: dict = None
+
+    # The time index of the last interpolation
+    _time: pd.Index = None
+
+    def __init__(self, lat: list, lon: list, alt: Union[list, int] = None) -> None:
+
+        self._lat = np.asarray(lat, dtype="float64")
+        self._lon = np.asarray(lon, dtype="float64")
+
+        if alt is None:
+            self.adapt_temp = False
+        else:
+            self._alt = np.broadcast_to(
+                np.asarray(alt, dtype="float64"), self.shape
+            ).ravel()
+
+    def _get_nearest(self, stations: pd.DataFrame) -> tuple:
+        """
+        Get position & distance of the nearest weather
+        stations for each cell (cells x max_count)
+        """
+
+        # Coordinates of all cells
+        lat, lon = np.meshgrid(self._lat, self._lon, indexing="ij")
+        lat, lon = lat.ravel(), lon.ravel()
+
+        # Station properties
+        station_lat = stations["latitude"].to_numpy(dtype="float64")
+        station_lon = stations["longitude"].to_numpy(dtype="float64")
+        elevation = stations["elevation"].to_numpy(dtype="float64")
+
+        # Number of slots per cell
+        count = min(self.max_count, len(stations.index))
+
+        index = np.zeros((lat.size, count), dtype="int64")
+        distance = np.full((lat.size, count), np.inf)
+
+        if count > 0:
+            for start in range(0, lat.size, self._chunk_size):
+                cells = slice(start, start + self._chunk_size)
+
+                # Get distance for each cell & station
+                dist = get_distance(
+                    lat[cells, None], lon[cells, None], station_lat, station_lon
+                )
+
+                # Exclude distant weather stations
+                excluded = dist > self.radius
+                if self._alt is not None and self.alt_range:
+                    excluded |= ~(
+                        np.abs(self._alt[cells, None] - elevation) <= self.alt_range
+                    )
+                dist[excluded] = np.inf
+
+                # Select nearest weather stations
+                nearest = np.argpartition(dist, count - 1, axis=1)[:, :count]
+                index[cells] = nearest
+                distance[cells] = np.take_along_axis(dist, nearest, axis=1)
+
+        return index, distance
+
+    def _set_weights(self, stations: pd.DataFrame) -> None:
+        """
+        Calculate the sparse cell x station weight matrix
+        """
+
+        index, distance = self._get_nearest(stations)
+
+        # Inverse distance weights
+        weights = np.where(
+            np.isfinite(distance), 1 / np.maximum(distance, 1) ** self.power, 0
+        )
+
+        # Only keep weather stations which are actually used
+        used, index = np.unique(np.where(weights > 0, index, -1), return_inverse=True)
+        index = index.reshape(weights.shape)
+        if used.size > 0 and used[0] == -1:
+            used = used[1:]
+            index = np.maximum(index - 1, 0)
+
+        # No weather station is close enough to any cell
+        if used.size == 0:
+            index, weights = index[:, :0], weights[:, :0]
+
+        self._stations = stations.index[used]
+        self._weights = {
+            "index": index,
+            "weight": weights,
+            "offset": np.zeros(index.shape),
+        }
+
+        # Altitude difference between weather stations & cells
+        if self._alt is not None:
+            elevation = stations["elevation"].to_numpy(dtype="float64")
+            self._weights["offset"] = np.nan_to_num(
+                (elevation[used][index] - self._alt[:, None]) / 100
+            )
+
+    def get_stations(
+        self,
+        freq: str = None,
+        start: datetime = None,
+        end: datetime = None,
+        model: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Get list of weather stations used by the grid
+        """
+
+        # Padding in degrees
+        pad_lat = np.rad2deg(self.radius / 6371000)
+        pad_lon = pad_lat / max(
+            np.cos(np.deg2rad(min(np.abs(self._lat).max() + pad_lat, 89))), 0.01
+        )
+
+        # Get weather stations around the grid
+        stations = Stations().bounds(
+            (self._lat.max() + pad_lat, self._lon.min() - pad_lon),
+            (self._lat.min() - pad_lat, self._lon.max() + pad_lon),
+        )
+
+        # Apply inventory filter
+        if freq and start and end:
+            age = (datetime.now() - end).days
+            if not model or age > 180:
+                stations = stations.inventory(freq, (start, end))
+
+        # Calculate weights
+        stations = stations.fetch()
+        self._set_weights(stations)
+
+        return stations.loc[self._stations]
+
+    def interpolate(self, data: MeteoData) -> dict:
+        """
+        Interpolate all parameters onto the grid
+        """
+
+        # Calculate weights if required
+        if self._weights is None:
+            self.get_stations()
+
+        df = data.fetch(view=True).select_dtypes("number")
+
+        # Single-station data has no station index
+        if "station" not in df.index.names:
+            if len(self._stations) != 1:
+                raise ValueError("Data must include the weather station index")
+            df = pd.concat([df], keys=self._stations, names=["station"])
+
+        # Time index
+        self._time = df.index.get_level_values("time").unique().sort_values()
+
+        # Lapse rates & months of all time steps
+        lapse_rates = LAPSE_RATES if self.lapse_rates is None else self.lapse_rates
+        months = self._time.month.to_numpy()
+
+        result = {}
+
+        for parameter in df.columns:
+            # Align station series on the time index (time x station)
+            values = (
+                df[parameter]
+                .unstack("station")
+                .reindex(index=self._time, columns=self._stations)
+                .to_numpy(dtype="float64", na_value=np.NaN)
+            )
+
+            # Interpolate wind direction through its vector components
+            if parameter == "wdir":
+                rads = np.deg2rad(values)
+                field = np.rad2deg(
+                    np.arctan2(self._apply(np.sin(rads)), self._apply(np.cos(rads)))
+                )
+                field = (field + 360) % 360
+
+            # Use the nearest weather station for categorical data
+            elif parameter == "coco":
+                field = self._apply_nearest(values)
+
+            # Adapt temperature-like data based on altitude
+            elif self.adapt_temp and parameter in lapse_rates:
+                field = self._apply(
+                    values,
+                    get_lapse_rates(lapse_rates, [parameter], months),
+                )
+
+            else:
+                field = self._apply(values)
+
+            # Reduce sea-level pressure based on altitude
+            if parameter == "pres" and self.adapt_pres and self._alt is not None:
+                field = field * reduce_pres(self._alt)
+
+            result[parameter] = np.round(field, 1).reshape(len(self._time), *self.shape)
+
+        return result
+
+    def _apply(
+        self, values: np.ndarray, lapse_rate: Union[np.ndarray, None] = None
+    ) -> np.ndarray:
+        """
+        Apply the weight matrix to all time steps
+        """
+
+        available = ~np.isnan(values)
+        values = np.where(available, values, 0)
+
+        shape = (values.shape[0], self._weights["index"].shape[0])
+        numerator = np.zeros(shape)
+        denominator = np.zeros(shape)
+        offset = np.zeros(shape)
+
+        for slot in range(self._weights["index"].shape[1]):
+            index = self._weights["index"][:, slot]
+
+            # Weights of available values (time x cell)
+            weights = available[:, index] * self._weights["weight"][:, slot]
+
+            numerator += values[:, index] * weights
+            denominator += weights
+
+            # Weighted altitude difference
+            if lapse_rate is not None:
+                offset += weights * self._weights["offset"][:, slot]
+
+        # Adapt data based on altitude
+        if lapse_rate is not None:
+            numerator += lapse_rate * offset
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(denominator > 0, numerator / denominator, np.NaN)
+
+    def _apply_nearest(self, values: np.ndarray) -> np.ndarray:
+        """
+        Use the value of the nearest weather station
+        with available data for all time steps
+        """
+
+        available = ~np.isnan(values)
+
+        shape = (values.shape[0], self._weights["index"].shape[0])
+        field = np.full(shape, np.NaN)
+        best = np.zeros(shape)
+
+        for slot in range(self._weights["index"].shape[1]):
+            index = self._weights["index"][:, slot]
+
+            # Weights of available values (time x cell)
+            weights = available[:, index] * self._weights["weight"][:, slot]
+
+            field = np.where(weights > best, values[:, index], field)
+            best = np.maximum(best, weights)
+
+        return field
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Returns the grid's shape (lat x lon)
+        """
+
+        return (self._lat.size, self._lon.size)
+
+    @property
+    def stations(self) -> pd.Index:
+        """
+        Returns the grid's weather stations
+        """
+
+        return self._stations
+
+    @property
+    def time(self) -> pd.Index:
+        """
+        Returns the time index of the last interpolation
+        """
+
+        return self._time
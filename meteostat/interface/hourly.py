@@ -112,7 +112,8 @@ class Hourly(TimeSeries):
             # Save timezone
             self._timezone = timezone
 
-            if start and end:
+            # Local times of the weather stations are naive
+            if start and end and timezone != "local":
 
                 # Initialize time zone
                 timezone = pytz.timezone(self._timezone)
@@ -123,27 +124,43 @@ class Hourly(TimeSeries):
                 # Set end date
                 end = timezone.localize(end, is_dst=None).astimezone(pytz.utc)
 
-        if self.chunked:
-            self._annual_steps = [start.year + i for i in range(end.year - start.year + 1)]
-
         self._start = start
         self._end = end
 
+        # Get (naive UTC) period which should be loaded
+        start, end = self._get_period()
+
+        if self.chunked:
+            self._annual_steps = [start.year + i for i in range(end.year - start.year + 1)]
+
     def __init__(
         self,
         loc: Union[pd.DataFrame, Point, list, str],  # Station(s) or geo point
         start: datetime = None,
         end: datetime = None,
-        timezone: str = None,
+        timezone: str = None,  # Time zone or "local" (drops 2nd hour at DST end)
         model: bool = True,  # Include model data?
         flags: bool = False,  # Load source flags?
+        *,
+        id_type: str = "id",  # Type of station identifiers (id, wmo or icao)
+        lazy: bool = False,  # Defer loading & processing until fetch()
+        parameters: list = None,  # Load selected parameters only
     ) -> None:
 
         # Set time zone and adapt period
         self._set_time(start, end, timezone)
 
         # Initialize time series
-        self._init_time_series(loc, start, end, model, flags)
+        self._init_time_series(
+            loc,
+            start,
+            end,
+            model,
+            flags,
+            id_type=id_type,
+            lazy=lazy,
+            parameters=parameters,
+        )
 
     def expected_rows(self) -> int:
         """
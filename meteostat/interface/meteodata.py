@@ -11,14 +11,26 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
+from datetime import datetime, timedelta, timezone
 from typing import Union
+import numpy as np
 import pandas as pd
 from meteostat.enumerations.granularity import Granularity
-from meteostat.core.cache import get_local_file_path, file_in_cache
+from meteostat.core.cache import (
+    get_local_file_path,
+    get_missing_file_path,
+    file_in_cache,
+)
 from meteostat.core.loader import processing_handler, load_handler
-from meteostat.utilities.mutations import localize, filter_time, adjust_temp
+from meteostat.utilities.mutations import (
+    filter_time,
+    adjust_temp,
+    densify,
+    sparsify,
+)
+from meteostat.utilities.helpers import to_datetime64, fuse_steps
 from meteostat.utilities.validations import validate_series
-from meteostat.utilities.aggregations import weighted_average
+from meteostat.utilities.aggregations import weighted_average, coalesce
 from meteostat.utilities.endpoint import generate_endpoint_path
 from meteostat.interface.base import Base
 
@@ -36,6 +48,149 @@ class MeteoData(Base):
     # The data frame
     _data: pd.DataFrame = pd.DataFrame()
 
+    # Inventory of the weather stations
+    _inventory: Union[pd.DataFrame, None] = None
+
+    # Query plan of lazy instances [(method, args, kwargs)]
+    _plan: Union[list, None] = None
+
+    # Is the DataFrame private to a running query plan (modifiable in place)?
+    _owned: bool = False
+
+    # Selected meteorological parameters (None = all)
+    _parameters: Union[list, None] = None
+
+    # Data types of the meteorological columns
+    _types: dict = {}
+
+    # Default aggregation functions
+    aggregations: dict = {}
+
+    # Columns which are required by derived parameters
+    _derived: dict = {}
+
+    # Data types of the compact schema (float32 by default)
+    _compact_types: dict = {"rhum": "Int16", "wdir": "Int16", "coco": "Int8"}
+
+    # Mostly empty columns which are always sparse in sparse mode
+    _sparse_columns: tuple = ("snow", "wpgt", "tsun", "coco")
+
+    def _set_parameters(self, parameters: Union[list, str, None]) -> None:
+        """
+        Select the meteorological parameters which should be loaded
+        """
+
+        if parameters is None:
+            return
+
+        if not isinstance(parameters, list):
+            parameters = [parameters]
+
+        # Check parameters
+        for parameter in parameters:
+            if parameter not in self._types and parameter not in self._derived:
+                raise ValueError(f"Invalid parameter {parameter}")
+
+        # Get required columns
+        required = set(parameters)
+        for parameter in parameters:
+            required.update(self._derived.get(parameter, []))
+
+        self._parameters = parameters
+        self._types = {
+            col: dtype for col, dtype in self._types.items() if col in required
+        }
+
+        self.aggregations = {
+            col: func for col, func in self.aggregations.items() if col in required
+        }
+
+    def _compact(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert meteorological data to the compact schema
+        """
+
+        df = densify(df)
+
+        # Numeric columns which use a different data type
+        types = {
+            col: self._compact_types.get(col, "float32")
+            for col, dtype in df.dtypes.items()
+            if col in self._types
+            and pd.api.types.is_numeric_dtype(dtype)
+            and dtype != self._compact_types.get(col, "float32")
+        }
+
+        # Integer types require whole numbers
+        rounded = {
+            col: df[col].round() for col, dtype in types.items() if dtype[0] == "I"
+        }
+        if rounded:
+            df = df.assign(**rounded)
+
+        return df.astype(types) if types else df
+
+    def _apply_sparse(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the sparse columns as sparse arrays in sparse
+        mode, use dense columns otherwise
+        """
+
+        if self.sparse:
+            return sparsify(df, None, self._sparse_columns)
+
+        return densify(df)
+
+    def _get_usecols(self) -> Union[list, None]:
+        """
+        Get the raw columns which should be parsed
+        """
+
+        if self._parameters is None:
+            return None
+
+        return [*self._columns[: self._first_met_col], *self._types]
+
+    def _get_cache_path(self, file: str) -> str:
+        """
+        Get the local cache path of a file (depending
+        on the selection of parameters)
+        """
+
+        path = get_local_file_path(self.cache_dir, self.cache_subdir, file)
+
+        # Prefer a cached copy of the full file
+        if self._parameters is None or (
+            self.max_age > 0 and file_in_cache(path, self.max_age)
+        ):
+            return path
+
+        return get_local_file_path(
+            self.cache_dir, self.cache_subdir, f"{file}?{','.join(self._types)}"
+        )
+
+    def _get_period(self) -> tuple:
+        """
+        Get the (naive UTC) period which should be loaded
+        """
+
+        start, end = self._start, self._end
+
+        if start is None or end is None:
+            return start, end
+
+        # Local times differ from UTC by up to 14 hours
+        if getattr(self, "_timezone", None) == "local":
+            return start - timedelta(hours=14), end + timedelta(hours=14)
+
+        # Remove time zone information
+        if start.tzinfo is not None:
+            start = start.astimezone(timezone.utc).replace(tzinfo=None)
+        if end.tzinfo is not None:
+            end = end.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return start, end
+
     def _load_data(self, station: str, year: Union[int, None] = None) -> None:
         """
         Load file for a single station from Meteostat
@@ -45,7 +200,7 @@ class MeteoData(Base):
         file = generate_endpoint_path(self.granularity, station, year)
 
         # Get local file path
-        path = get_local_file_path(self.cache_dir, self.cache_subdir, file)
+        path = self._get_cache_path(file)
 
         # Check if file in cache
         if self.max_age > 0 and file_in_cache(path, self.max_age):
@@ -53,11 +208,25 @@ class MeteoData(Base):
             # Read cached data
             df = pd.read_pickle(path)
 
+        # Check if file is known to be missing
+        elif self.max_age > 0 and file_in_cache(
+            get_missing_file_path(path), self.missing_max_age
+        ):
+
+            # Create empty DataFrame
+            df = validate_series(pd.DataFrame(columns=[*self._types]), station)
+
         else:
 
             # Get data from Meteostat
             df = load_handler(
-                self.endpoint, file, self._columns, self._types, self._parse_dates
+                self.endpoint,
+                file,
+                self._columns,
+                self._types,
+                self._parse_dates,
+                usecols=self._get_usecols(),
+                missing_path=path if self.max_age > 0 else None,
             )
 
             # Validate and prepare data for further processing
@@ -72,56 +241,122 @@ class MeteoData(Base):
             else:
                 df = validate_series(df, station)
 
+            # Cache sparse columns as sparse arrays
+            df = self._apply_sparse(df)
+
             # Save as Pickle
-            if self.max_age > 0:
+            if self.max_age > 0 and df.index.size > 0:
                 df.to_pickle(path)
 
-        # Localize time column
-        if (
-            self.granularity == Granularity.HOURLY
-            and self._timezone is not None
-            and len(df.index) > 0
-        ):
-            df = localize(df, self._timezone)
+        # Select parameters from full cache files
+        if len(df.columns) > len(self._types):
+            df = df[[*self._types]]
+
+        # Use compact data types
+        if self.compact:
+            df = self._compact(df)
 
         # Filter time period and append to DataFrame
-        # pylint: disable=no-else-return
         if self.granularity == Granularity.NORMALS and df.index.size > 0 and self._end:
             # Get time index
             end = df.index.get_level_values("end")
-            # Filter & return
-            return df.loc[end == self._end]
+            # Filter
+            df = df.loc[end == self._end]
         elif not self.granularity == Granularity.NORMALS:
-            df = filter_time(df, self._start, self._end)
+            df = filter_time(df, *self._get_period())
+
+        # Use the same sparse columns in all chunks, so that they
+        # are concatenated without densifying (others are decided
+        # after concatenation)
+        df = self._apply_sparse(df)
 
         # Return
         return df
 
+    def _plan_datasets(self, years: list) -> np.ndarray:
+        """
+        Check which chunks (stations x years) can exist
+        based on the weather stations' inventory
+        """
+
+        # Inventory of the granularity
+        inventory = self._inventory.reindex(self._stations.astype(str))
+        start = inventory[f"{self.granularity.value}_start"].to_numpy("datetime64[ns]")
+        end = inventory[f"{self.granularity.value}_end"].to_numpy("datetime64[ns]")
+        start, end = start[:, None], end[:, None]
+
+        # Period of each chunk
+        period_start, period_end = self._get_period()
+        period_start = to_datetime64(period_start, np.datetime64("1700-01-01"))
+        period_end = to_datetime64(period_end, np.datetime64("2200-01-01"))
+        if years[0] is None:
+            chunk_start = np.array([period_start])
+            chunk_end = np.array([period_end])
+        else:
+            chunk_start = np.maximum(
+                np.array([f"{year}-01-01" for year in years], dtype="datetime64[ns]"),
+                period_start,
+            )
+            chunk_end = np.minimum(
+                np.array(
+                    [f"{year + 1}-01-01" for year in years], dtype="datetime64[ns]"
+                )
+                - np.timedelta64(1, "ns"),
+                period_end,
+            )
+
+        # The inventory might not cover recent model data
+        trusted = (not self._model) | (
+            chunk_end < np.datetime64(datetime.now() - timedelta(days=180))
+        )
+
+        # Data is published with a delay
+        delay = np.timedelta64(timedelta(days=1, seconds=self.max_age))
+
+        missing = np.isnat(start)
+        excluded = (start > chunk_end) | (
+            trusted & (missing | (end + delay < chunk_start))
+        )
+
+        # Load all chunks of weather stations which are not in the inventory
+        known = self._stations.astype(str).isin(self._inventory.index.astype(str))
+
+        return ~(excluded & known[:, None])
+
     def _get_datasets(self) -> list:
         """
         Get list of datasets
         """
 
+        stations = [str(station) for station in self._stations]
+
         if self.granularity == Granularity.HOURLY and self.chunked:
-            datasets = [
-                (str(station), year)
-                for station in self._stations
-                for year in self._annual_steps
-            ]
+            years = self._annual_steps
+        else:
+            years = [None]
+
+        # Skip chunks which cannot exist
+        if self._inventory is not None and len(stations) > 0:
+            required = self._plan_datasets(years)
         else:
-            datasets = [(str(station),) for station in self._stations]
+            required = np.ones((len(stations), len(years)), dtype=bool)
 
-        return datasets
+        return [
+            (station,) if year is None else (station, year)
+            for i, station in enumerate(stations)
+            for j, year in enumerate(years)
+            if required[i, j]
+        ]
 
     def _get_data(self) -> None:
         """
         Get all required data dumps
         """
 
-        if len(self._stations) > 0:
+        # Get list of datasets
+        datasets = self._get_datasets()
 
-            # Get list of datasets
-            datasets = self._get_datasets()
+        if len(datasets) > 0:
 
             # Data Processings
             return processing_handler(
@@ -131,9 +366,37 @@ class MeteoData(Base):
         # Empty DataFrame
         return pd.DataFrame(columns=[*self._types])
 
+    def _compile(self) -> None:
+        """
+        Execute the query plan of a lazy instance
+        """
+
+        if self._plan is None:
+            return
+
+        # Fuse consecutive unit conversions of different columns
+        steps, self._plan = fuse_steps(self._plan), None
+
+        # Run all steps, modifying DataFrames which were
+        # created by the query plan in place
+        temp, shared = self, self._data
+        for func, args, kwargs in steps:
+            temp._owned = temp._data is not shared
+            temp = func(temp, *args, **kwargs) or temp
+
+        self._data = temp._data
+        self._owned = False
+
     # pylint: disable=too-many-branches
     def _resolve_point(
-        self, method: str, stations: pd.DataFrame, alt: int, adapt_temp: bool
+        self,
+        method: str,
+        stations: pd.DataFrame,
+        alt: int,
+        adapt_temp: bool,
+        *,
+        lapse_rates: Union[dict, None] = None,
+        adapt_pres: bool = False,
     ) -> None:
         """
         Project weather station data onto a single point
@@ -142,15 +405,20 @@ class MeteoData(Base):
         if self._stations.size == 0 or self._data.size == 0:
             return None
 
+        # Use dense columns
+        self._data = densify(self._data)
+
         if method == "nearest":
 
-            if adapt_temp:
+            if adapt_temp or adapt_pres:
 
                 # Join elevation of involved weather stations
                 data = self._data.join(stations["elevation"], on="station")
 
                 # Adapt temperature-like data based on altitude
-                data = adjust_temp(data, alt)
+                data = adjust_temp(
+                    data, alt, lapse_rates if adapt_temp else {}, adapt_pres
+                )
 
                 # Drop elevation & round
                 data = data.drop("elevation", axis=1).round(1)
@@ -159,13 +427,18 @@ class MeteoData(Base):
 
                 data = self._data
 
-            if self.granularity == Granularity.NORMALS:
-                self._data = data.groupby(level=["start", "end", "month"]).agg("first")
-
+            # Prioritize weather stations by score
+            if "score" in stations.columns:
+                priority = stations.sort_values("score", ascending=False).index
             else:
-                self._data = data.groupby(
-                    pd.Grouper(level="time", freq=self._freq)
-                ).agg("first")
+                priority = stations.index
+
+            # Fill each value from the best station which provides it
+            self._data = coalesce(data, priority)
+
+            # Create a regular time series
+            if not self.granularity == Granularity.NORMALS:
+                self._data = self._data.asfreq(self._freq)
 
         else:
 
@@ -173,12 +446,18 @@ class MeteoData(Base):
             data = self._data.join(stations[["score", "elevation"]], on="station")
 
             # Adapt temperature-like data based on altitude
-            if adapt_temp:
-                data = adjust_temp(data, alt)
+            if adapt_temp or adapt_pres:
+                data = adjust_temp(
+                    data, alt, lapse_rates if adapt_temp else {}, adapt_pres
+                )
 
             # Exclude non-mean data & perform aggregation
-            if not self.granularity == Granularity.NORMALS:
-                excluded = data["wdir"]
+            if not self.granularity == Granularity.NORMALS and "wdir" in data.columns:
+                # Take the first value in order of the weather stations
+                priority = stations.index.get_indexer(
+                    data.index.get_level_values("station")
+                )
+                excluded = data["wdir"].iloc[np.argsort(priority, kind="stable")]
                 excluded = excluded.groupby(
                     pd.Grouper(level="time", freq=self._freq)
                 ).agg("first")
@@ -204,11 +483,16 @@ class MeteoData(Base):
                 data.index = data.index.droplevel(1)
 
                 # Merge excluded fields
-                data["wdir"] = excluded
+                if "wdir" in data.columns:
+                    data["wdir"] = excluded
 
             # Drop score and elevation
             self._data = data.drop(["score", "elevation"], axis=1).round(1)
 
+        # Restore compact data types
+        if self.compact:
+            self._data = self._compact(self._data)
+
         # Set placeholder station ID
         self._data["station"] = "XXXXX"
 
@@ -83,6 +83,10 @@ class Monthly(TimeSeries):
         end: datetime = None,
         model: bool = True,  # Include model data?
         flags: bool = False,  # Load source flags?
+        *,
+        id_type: str = "id",  # Type of station identifiers (id, wmo or icao)
+        lazy: bool = False,  # Defer loading & processing until fetch()
+        parameters: list = None,  # Load selected parameters only
     ) -> None:
 
         # Set start date
@@ -90,7 +94,16 @@ class Monthly(TimeSeries):
             start = start.replace(day=1)
 
         # Initialize time series
-        self._init_time_series(loc, start, end, model, flags)
+        self._init_time_series(
+            loc,
+            start,
+            end,
+            model,
+            flags,
+            id_type=id_type,
+            lazy=lazy,
+            parameters=parameters,
+        )
 
     def expected_rows(self) -> int:
         """
@@ -16,6 +16,13 @@ import pandas as pd
 from meteostat.enumerations.granularity import Granularity
 from meteostat.core.warn import warn
 from meteostat.interface.meteodata import MeteoData
+from meteostat.utilities.mutations import (
+    categorize_stations,
+    densify,
+    drop_levels,
+    read_only,
+    sparsify,
+)
 from meteostat.interface.point import Point
 
 
@@ -73,13 +80,20 @@ class Normals(MeteoData):
     # Which columns should be parsed as dates?
     _parse_dates = None
 
+    # Columns which are required by derived parameters
+    _derived: dict = {"tavg": ["tmin", "tmax"]}
+
     def __init__(
         self,
         loc: Union[pd.DataFrame, Point, list, str],
         start: int = None,
         end: int = None,
+        parameters: list = None,  # Load selected parameters only
     ) -> None:
 
+        # Select parameters
+        self._set_parameters(parameters)
+
         # Set list of weather stations
         if isinstance(loc, pd.DataFrame):
             self._stations = loc.index
@@ -113,9 +127,20 @@ class Normals(MeteoData):
         # Get data for all weather stations
         self._data = self._get_data()
 
+        # Store mostly empty columns as sparse arrays
+        if self.sparse:
+            self._data = sparsify(self._data, self.sparse_density)
+
         # Interpolate data
         if isinstance(loc, Point):
-            self._resolve_point(loc.method, stations, loc.alt, loc.adapt_temp)
+            self._resolve_point(
+                loc.method,
+                stations,
+                loc.alt,
+                loc.adapt_temp,
+                lapse_rates=loc.lapse_rates,
+                adapt_pres=loc.adapt_pres,
+            )
 
         # Clear cache
         if self.max_age > 0 and self.autoclean:
@@ -132,64 +157,95 @@ class Normals(MeteoData):
         if self.count() == 0:
             warn("Pointless normalization of empty DataFrame")
 
-        # Go through list of weather stations
-        for station in temp._stations:
-            # The list of periods
-            periods: pd.Index = pd.Index([])
-            # Get periods
-            if self.count() > 0:
-                periods = temp._data[
-                    temp._data.index.get_level_values("station") == station
-                ].index.unique("end")
-            elif periods.size == 0 and self._end:
-                periods = pd.Index([self._end])
-            # Go through all periods
-            for period in periods:
-                # Create DataFrame
-                df = pd.DataFrame(columns=temp._columns[temp._first_met_col :])
-                # Populate index columns
-                df["month"] = range(1, 13)
-                df["station"] = station
-                df["start"] = period - 29
-                df["end"] = period
-                # Set index
-                df.set_index(["station", "start", "end", "month"], inplace=True)
-                # Merge data
-                temp._data = (
-                    pd.concat([temp._data, df], axis=0)
-                    .groupby(["station", "start", "end", "month"], as_index=True)
-                    .first()
-                    if temp._data.index.size > 0
-                    else df
+        # Periods of each weather station
+        if self.count() > 0:
+            periods = pd.MultiIndex.from_arrays(
+                [
+                    temp._data.index.get_level_values("station"),
+                    temp._data.index.get_level_values("end"),
+                ]
+            ).unique()
+            periods = periods[periods.get_level_values(0).isin(temp._stations)]
+        elif self._end:
+            periods = pd.MultiIndex.from_product([temp._stations, [self._end]])
+        else:
+            periods = pd.MultiIndex.from_arrays([[], []])
+
+        if len(periods) > 0:
+
+            # Full index (station x period x month)
+            end = periods.get_level_values(1).repeat(12)
+            index = pd.MultiIndex.from_arrays(
+                [
+                    periods.get_level_values(0).repeat(12),
+                    end - 29,
+                    end,
+                    np.tile(np.arange(1, 13), len(periods)),
+                ],
+                names=["station", "start", "end", "month"],
+            )
+
+            if temp._data.index.size == 0:
+                temp._data = pd.DataFrame(
+                    index=index, columns=[*temp._types], dtype="float64"
                 )
 
+            else:
+                # Merge duplicate rows
+                if temp._data.index.has_duplicates:
+                    temp._data = temp._data.groupby(level=index.names).first()
+
+                # Keep existing rows outside of the full index
+                extra = temp._data.index.difference(index)
+                if len(extra) > 0:
+                    index = index.append(extra)
+
+                # Reindex data
+                temp._data = temp._data.reindex(index).sort_index()
+
         # None -> NaN
         temp._data = temp._data.fillna(np.NaN)
 
         # Return class instance
         return temp
 
-    def fetch(self) -> pd.DataFrame:
+    def fetch(self, view: bool = False) -> pd.DataFrame:
         """
-        Fetch DataFrame
+        Fetch DataFrame (or a read-only view of the data)
+
+        Views share memory with the instance. Writing to them,
+        including in-place methods like fillna(inplace=True),
+        raises a ValueError; use copy() to get a writable frame
         """
 
-        # Copy DataFrame
-        temp = copy(self._data)
+        # Copy DataFrame or create a view (with dense columns)
+        temp = densify(self._data)
+        if temp is self._data:
+            temp = read_only(temp) if view else temp.copy()
 
         # Add avg. temperature column
-        temp.insert(
-            0, "tavg", temp[["tmin", "tmax"]].dropna(how="any").mean(axis=1).round(1)
-        )
+        if "tmin" in temp.columns and "tmax" in temp.columns:
+            temp.insert(
+                0,
+                "tavg",
+                temp[["tmin", "tmax"]].dropna(how="any").mean(axis=1).round(1),
+            )
+
+        # Select parameters
+        if self._parameters is not None:
+            temp = temp[[col for col in temp.columns if col in self._parameters]]
 
         # Remove station index if it's a single station
         if len(self._stations) == 1 and "station" in temp.index.names:
-            temp = temp.reset_index(level="station", drop=True)
+            temp = drop_levels(temp, "station")
+
+        # Use categorical weather station IDs
+        elif self.compact:
+            temp = categorize_stations(temp)
 
         # Remove start & end year if period is set
         if self._start and self._end and self.count() > 0:
-            temp = temp.reset_index(level="start", drop=True)
-            temp = temp.reset_index(level="end", drop=True)
+            temp = drop_levels(temp, ["start", "end"])
 
         # Return data frame
         return temp
@@ -34,6 +34,12 @@ class Point:
     # Adapt temperature data based on altitude
     adapt_temp: bool = True
 
+    # Temperature difference by 100 meters per parameter (None = default)
+    lapse_rates: dict = None
+
+    # Reduce sea-level pressure to the point's altitude
+    adapt_pres: bool = False
+
     # Distance Weight
     weight_dist: float = 0.6
 
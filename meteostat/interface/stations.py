@@ -9,13 +9,19 @@ The code is licensed under the MIT license.
 """
 
 from copy import copy
-from datetime import datetime, timedelta
-from typing import Union
+from datetime import datetime
+from typing import Callable, Union
+import numpy as np
 import pandas as pd
 from meteostat.core.cache import get_local_file_path, file_in_cache
 from meteostat.core.loader import load_handler
+from meteostat.core.snapshot import save_snapshot, load_snapshot
 from meteostat.interface.base import Base
 from meteostat.utilities.helpers import get_distance
+from meteostat.utilities.mutations import convert_units
+
+# Integer representation of NaT
+NAT = np.iinfo("int64").min
 
 
 class Stations(Base):
@@ -27,9 +33,27 @@ class Stations(Base):
     # The cache subdirectory
     cache_subdir: str = "stations"
 
-    # The list of selected weather Stations
+    # The full list of weather stations
     _data: pd.DataFrame = None
 
+    # Filters of the query plan (cost, predicate)
+    _filters: list = []
+
+    # Reference points for distance calculation (lat, lon, radius)
+    _nearby: list = []
+
+    # Unit conversions
+    _units: list = []
+
+    # The list of selected weather stations
+    _result: Union[pd.DataFrame, None] = None
+
+    # Availability intervals by granularity
+    _intervals: dict = {}
+
+    # Hash indexes by identifier type
+    _indexes: dict = {}
+
     # Raw data columns
     _columns: list = [
         "id",
@@ -54,16 +78,19 @@ class Stations(Base):
     _types: dict = {
         "id": "string",
         "name": "object",
-        "country": "string",
-        "region": "string",
+        "country": "category",
+        "region": "category",
         "wmo": "string",
         "icao": "string",
         "latitude": "float64",
         "longitude": "float64",
         "elevation": "float64",
-        "timezone": "string",
+        "timezone": "category",
     }
 
+    # Precision of coordinates in snapshots
+    _decimals: dict = {"latitude": 4, "longitude": 4, "elevation": 1}
+
     # Columns for date parsing
     _parse_dates: list = [10, 11, 12, 13, 14, 15]
 
@@ -76,56 +103,154 @@ class Stations(Base):
         file = "stations/slim.csv.gz"
 
         # Get local file path
-        path = get_local_file_path(self.cache_dir, self.cache_subdir, file)
+        path = get_local_file_path(
+            self.cache_dir, self.cache_subdir, f"{file}.snapshot"
+        )
 
         # Check if file in cache
         if self.max_age > 0 and file_in_cache(path, self.max_age):
 
             # Read cached data
-            df = pd.read_pickle(path)
+            df = load_snapshot(path)
 
         else:
 
             # Get data from Meteostat
             df = load_handler(
-                self.endpoint, file, self._columns, self._types, self._parse_dates, True
+                self.endpoint,
+                file,
+                self._columns,
+                self._types,
+                self._parse_dates,
+                coerce_dates=True,
             )
 
             # Add index
             df = df.set_index("id")
 
-            # Save as Pickle
+            # Save as binary snapshot
             if self.max_age > 0:
-                df.to_pickle(path)
+                save_snapshot(df, path, self._decimals)
 
         # Set data
         self._data = df
 
+        # Reset availability intervals & identifier indexes
+        self._intervals = {}
+        self._indexes = {}
+
     def __init__(self) -> None:
 
         # Get all weather stations
         self._load()
 
-    def nearby(self, lat: float, lon: float, radius: int = None) -> "Stations":
+        # Initialize query plan
+        self._filters = []
+        self._nearby = []
+        self._units = []
+
+    def _get_public(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Sort/filter weather stations by physical distance
+        Get a copy of weather station data with public data
+        types (categorical columns are returned as strings)
+        """
+
+        return df.astype(
+            {col: "string" for col, dtype in self._types.items() if dtype == "category"}
+        )
+
+    def _filter(
+        self,
+        predicate: Callable[[pd.DataFrame, np.ndarray], pd.Series],
+        cost: int,
+    ):
+        """
+        Add a filter to the query plan
+
+        Predicates get the selected weather stations and their
+        positions in the full list of weather stations
         """
 
         # Create temporal instance
         temp = copy(self)
 
-        # Get distance for each station
-        temp._data["distance"] = get_distance(
-            lat, lon, temp._data["latitude"], temp._data["longitude"]
-        )
+        # Add predicate
+        temp._filters = [*self._filters, (cost, predicate)]
+        temp._result = None
+
+        # Return class instance
+        return temp
+
+    def _compile(self) -> pd.DataFrame:
+        """
+        Apply the query plan to the full list of weather stations
+        """
 
-        # Filter by radius
-        if radius:
-            temp._data = temp._data[temp._data["distance"] <= radius]
+        if self._result is not None:
+            return self._result
+
+        df = self._data
+
+        # Positions of selected weather stations
+        rows = np.arange(len(df.index))
+        distance = None
+
+        # Apply cheap filters first, then evaluate the remaining
+        # predicates on the selected weather stations only
+        for _, predicate in sorted(self._filters, key=lambda item: item[0]):
+            if rows.size == 0:
+                break
+            selected = predicate(
+                df if rows.size == len(df.index) else df.take(rows), rows
+            )
+            if isinstance(selected, pd.Series):
+                selected = selected.to_numpy(dtype=bool, na_value=False)
+            rows = rows[selected]
+
+        # Get distance for each remaining station
+        for lat, lon, radius in self._nearby:
+            distance = get_distance(
+                lat,
+                lon,
+                df["latitude"].to_numpy()[rows],
+                df["longitude"].to_numpy()[rows],
+            )
+
+            # Filter by radius
+            if radius:
+                rows = rows[distance <= radius]
+                distance = distance[distance <= radius]
 
         # Sort stations by distance
-        temp._data.columns.str.strip()
-        temp._data = temp._data.sort_values("distance")
+        if distance is not None:
+            order = np.argsort(distance, kind="stable")
+            rows, distance = rows[order], distance[order]
+
+        # Select weather stations
+        result = df.take(rows)
+        if distance is not None:
+            result["distance"] = distance
+
+        # Change data units
+        for units in self._units:
+            result = convert_units(result, units)
+
+        # Cache result
+        self._result = result
+
+        return result
+
+    def nearby(self, lat: float, lon: float, radius: int = None) -> "Stations":
+        """
+        Sort/filter weather stations by physical distance
+        """
+
+        # Create temporal instance
+        temp = copy(self)
+
+        # Add reference point
+        temp._nearby = [*self._nearby, (lat, lon, radius)]
+        temp._result = None
 
         # Return self
         return temp
@@ -135,15 +260,12 @@ class Stations(Base):
         Filter weather stations by country/region code
         """
 
-        # Create temporal instance
-        temp = copy(self)
-
         # Country code
-        temp._data = temp._data[temp._data["country"] == country]
+        temp = self._filter(lambda df, _: df["country"] == country, 0)
 
         # State code
         if state is not None:
-            temp._data = temp._data[temp._data["region"] == state]
+            temp = temp._filter(lambda df, _: df["region"] == state, 0)
 
         # Return self
         return temp
@@ -153,19 +275,46 @@ class Stations(Base):
         Filter weather stations by geographical bounds
         """
 
-        # Create temporal instance
-        temp = copy(self)
-
         # Return stations in boundaries
-        temp._data = temp._data[
-            (temp._data["latitude"] <= top_left[0])
-            & (temp._data["latitude"] >= bottom_right[0])
-            & (temp._data["longitude"] <= bottom_right[1])
-            & (temp._data["longitude"] >= top_left[1])
-        ]
+        return self._filter(
+            lambda df, _: (df["latitude"] <= top_left[0])
+            & (df["latitude"] >= bottom_right[0])
+            & (df["longitude"] <= bottom_right[1])
+            & (df["longitude"] >= top_left[1]),
+            1,
+        )
 
-        # Return self
-        return temp
+    def _get_intervals(self, freq: str) -> tuple:
+        """
+        Get availability intervals of all weather stations as
+        int64 arrays
+        """
+
+        if freq not in self._intervals:
+            start = self._data[freq + "_start"].to_numpy("datetime64[ns]").view("int64")
+            end = self._data[freq + "_end"].to_numpy("datetime64[ns]").view("int64")
+
+            # Missing start dates never match
+            start = np.where(start == NAT, np.iinfo("int64").max, start)
+
+            self._intervals[freq] = (start, end)
+
+        return self._intervals[freq]
+
+    def _covered(
+        self, freq: str, start: np.ndarray, end: np.ndarray, rows: np.ndarray
+    ) -> np.ndarray:
+        """
+        Check which of the weather stations at the given
+        positions cover a list of periods (periods x rows)
+        """
+
+        starts, ends = self._get_intervals(freq)
+
+        # Check start & end date
+        return (starts[rows] <= start[:, None]) & (
+            ends[rows] >= end[:, None] - self.max_age * 10**9
+        )
 
     def inventory(
         self, freq: str, required: Union[datetime, tuple, bool] = True
@@ -174,36 +323,88 @@ class Stations(Base):
         Filter weather stations by inventory data
         """
 
-        # Create temporal instance
-        temp = copy(self)
-
         if required is True:
             # Make sure data exists at all
-            temp._data = temp._data[(pd.isna(temp._data[freq + "_start"]) == False)]
-
-        elif isinstance(required, tuple):
-            # Make sure data exists across period
-            temp._data = temp._data[
-                (pd.isna(temp._data[freq + "_start"]) == False)
-                & (temp._data[freq + "_start"] <= required[0])
-                & (
-                    temp._data[freq + "_end"] + timedelta(seconds=temp.max_age)
-                    >= required[1]
-                )
-            ]
+            return self._filter(lambda df, _: pd.isna(df[freq + "_start"]) == False, 2)
 
-        else:
+        if not isinstance(required, tuple):
             # Make sure data exists on a certain day
-            temp._data = temp._data[
-                (pd.isna(temp._data[freq + "_start"]) == False)
-                & (temp._data[freq + "_start"] <= required)
-                & (
-                    temp._data[freq + "_end"] + timedelta(seconds=temp.max_age)
-                    >= required
-                )
-            ]
+            required = (required, required)
+
+        # Make sure data exists across period
+        return self._filter(
+            lambda _, rows: self._covered(
+                freq,
+                np.array([pd.Timestamp(required[0]).value]),
+                np.array([pd.Timestamp(required[1]).value]),
+                rows,
+            )[0],
+            2,
+        )
 
-        return temp
+    def availability(self, freq: str, periods: list) -> pd.DataFrame:
+        """
+        Check which of the selected weather stations
+        cover each of a list of (start, end) periods
+        """
+
+        # Start & end dates as int64
+        periods = pd.DataFrame(periods, columns=["start", "end"])
+        start = pd.to_datetime(periods["start"]).to_numpy("datetime64[ns]")
+        end = pd.to_datetime(periods["end"]).to_numpy("datetime64[ns]")
+
+        # Positions of selected weather stations
+        rows = self._data.index.get_indexer(self._compile().index)
+
+        return pd.DataFrame(
+            self._covered(freq, start.view("int64"), end.view("int64"), rows),
+            index=pd.MultiIndex.from_arrays([start, end], names=["start", "end"]),
+            columns=self._data.index[rows],
+        )
+
+    def _get_index(self, id_type: str) -> tuple:
+        """
+        Get a hash index of all WMO or ICAO identifiers
+        """
+
+        if id_type not in ("wmo", "icao"):
+            raise ValueError("Invalid identifier type")
+
+        if id_type not in self._indexes:
+            codes = self._data[id_type]
+
+            # Skip missing & duplicate identifiers
+            valid = (codes.notna() & ~codes.duplicated()).to_numpy(dtype=bool)
+
+            self._indexes[id_type] = (
+                pd.Index(codes[valid].astype(str)),
+                self._data.index[valid],
+            )
+
+        return self._indexes[id_type]
+
+    def identify(self, codes: list, id_type: str = "wmo") -> pd.Index:
+        """
+        Map a list of WMO or ICAO identifiers to Meteostat IDs
+        """
+
+        index, ids = self._get_index(id_type)
+
+        # Get positions of all identifiers
+        rows = index.get_indexer(pd.Index(codes).astype(str))
+
+        return pd.Index(
+            np.where(rows > -1, ids.to_numpy(dtype=object)[rows], None), name="id"
+        )
+
+    def lookup(self, codes: list, id_type: str = "wmo") -> pd.DataFrame:
+        """
+        Get weather stations by a list of WMO or ICAO identifiers
+        """
+
+        ids = self.identify(codes, id_type)
+
+        return self._get_public(self._data.loc[ids[ids.notna()]])
 
     def convert(self, units: dict) -> "Stations":
         """
@@ -213,10 +414,9 @@ class Stations(Base):
         # Create temporal instance
         temp = copy(self)
 
-        # Change data units
-        for parameter, unit in units.items():
-            if parameter in temp._data.columns.values:
-                temp._data[parameter] = temp._data[parameter].apply(unit)
+        # Add unit conversion
+        temp._units = [*self._units, units]
+        temp._result = None
 
         # Return class instance
         return temp
@@ -226,7 +426,7 @@ class Stations(Base):
         Return number of weather stations in current selection
         """
 
-        return len(self._data.index)
+        return len(self._compile().index)
 
     def fetch(self, limit: int = None, sample: bool = False) -> pd.DataFrame:
         """
@@ -234,7 +434,7 @@ class Stations(Base):
         """
 
         # Copy DataFrame
-        temp = copy(self._data)
+        temp = self._get_public(self._compile())
 
         # Return limited number of sampled entries
         if sample and limit:
@@ -9,20 +9,26 @@ The code is licensed under the MIT license.
 """
 
 from datetime import datetime
+from string import ascii_uppercase
 from typing import Union
 import numpy as np
 import pandas as pd
 from meteostat.enumerations.granularity import Granularity
-from meteostat.core.cache import get_local_file_path, file_in_cache
+from meteostat.core.cache import (
+    get_missing_file_path,
+    file_in_cache,
+)
 from meteostat.core.loader import processing_handler, load_handler
-from meteostat.utilities.mutations import localize, filter_time
+from meteostat.utilities.mutations import localize, filter_time, sparsify
 from meteostat.utilities.validations import validate_series
 from meteostat.utilities.endpoint import generate_endpoint_path
+from meteostat.core.warn import warn
+from meteostat.interface.stations import Stations
 from meteostat.interface.point import Point
 from meteostat.interface.meteodata import MeteoData
 
 
-class TimeSeries(MeteoData):
+class TimeSeries(MeteoData):  # pylint: disable=too-many-instance-attributes
 
     """
     TimeSeries class which provides features which are
@@ -44,6 +50,40 @@ class TimeSeries(MeteoData):
     # Fetch source flags?
     _flags = bool = False
 
+    # Time zone of each weather station (local time only)
+    _timezones: Union[pd.Series, None] = None
+
+    # Data type of source flags (unknown flags are encoded as "?")
+    _flag_type = pd.CategoricalDtype([*ascii_uppercase, "?"])
+
+    def _encode_flags(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encode source flags as categorical codes
+        """
+
+        known = set(self._flag_type.categories)
+        unknown = False
+        encoded = {}
+
+        for col in df.columns:
+            flags = df[col].astype("category")
+
+            # Flags which include the model flag count as model data
+            mapping = {
+                flag: flag
+                if flag in known
+                else (self._model_flag if self._model_flag in str(flag) else "?")
+                for flag in flags.cat.categories
+            }
+            unknown |= any(flag not in known for flag in mapping)
+
+            encoded[col] = flags.map(mapping).astype(self._flag_type)
+
+        if unknown:
+            warn("Encoding unknown source flags as ?")
+
+        return df.assign(**encoded)
+
     def _load_flags(self, station: str, year: Union[int, None] = None) -> None:
         """
         Load flag file for a single station from Meteostat
@@ -53,7 +93,7 @@ class TimeSeries(MeteoData):
         file = generate_endpoint_path(self.granularity, station, year, True)
 
         # Get local file path
-        path = get_local_file_path(self.cache_dir, self.cache_subdir, file)
+        path = self._get_cache_path(file)
 
         # Check if file in cache
         if self.max_age > 0 and file_in_cache(path, self.max_age):
@@ -61,6 +101,14 @@ class TimeSeries(MeteoData):
             # Read cached data
             df = pd.read_pickle(path)
 
+        # Check if file is known to be missing
+        elif self.max_age > 0 and file_in_cache(
+            get_missing_file_path(path), self.missing_max_age
+        ):
+
+            # Create empty DataFrame
+            df = validate_series(pd.DataFrame(columns=[*self._types]), station)
+
         else:
 
             # Get data from Meteostat
@@ -68,83 +116,131 @@ class TimeSeries(MeteoData):
                 self.endpoint,
                 file,
                 self._columns,
-                {key: "string" for key in self._columns[self._first_met_col :]},
+                {key: "category" for key in self._types},
                 self._parse_dates,
+                usecols=self._get_usecols(),
+                missing_path=path if self.max_age > 0 else None,
             )
 
             # Validate Series
             df = validate_series(df, station)
 
             # Save as Pickle
-            if self.max_age > 0:
+            if self.max_age > 0 and df.index.size > 0:
                 df.to_pickle(path)
 
-        # Localize time column
-        if (
-            self.granularity == Granularity.HOURLY
-            and self._timezone is not None
-            and len(df.index) > 0
-        ):
-            df = localize(df, self._timezone)
+        # Select parameters from full cache files
+        if len(df.columns) > len(self._types):
+            df = df[[*self._types]]
+
+        # Encode source flags
+        df = self._encode_flags(df)
 
         # Filter time period and append to DataFrame
-        if self._start and self._end:
-            df = filter_time(df, self._start, self._end)
+        df = filter_time(df, *self._get_period())
 
         return df
 
-    def _get_flags(self) -> None:
+    def _load_data_flags(
+        self, station: str, year: Union[int, None] = None
+    ) -> pd.DataFrame:
         """
-        Get all source flags
+        Load data & source flags for a single station from Meteostat
         """
 
-        if len(self._stations) > 0:
+        # Get data & flags
+        df = self._load_data(station, year)
+        flags = self._load_flags(station, year)
+
+        # Join flags
+        return df.join(flags, how="left", rsuffix="_flag")
 
-            # Get list of datasets
-            datasets = self._get_datasets()
+    def _get_data_flags(self) -> pd.DataFrame:
+        """
+        Get all data & source flags
+        """
+
+        # Get list of datasets
+        datasets = self._get_datasets()
+
+        if len(datasets) > 0:
 
             # Data Processings
             return processing_handler(
-                datasets, self._load_flags, self.processes, self.threads
+                datasets, self._load_data_flags, self.processes, self.threads
             )
 
         # Empty DataFrame
-        return pd.DataFrame(columns=[*self._types])
+        return pd.DataFrame(
+            columns=[*self._types, *map(lambda col: f"{col}_flag", self._types)]
+        )
 
     def _filter_model(self) -> None:
         """
         Remove model data from time series
         """
 
-        columns = self._columns[self._first_met_col :]
+        columns = [*self._types]
+        flags = [f"{col_name}_flag" for col_name in columns]
+
+        # Get category codes of all source flags
+        codes = np.column_stack(
+            [
+                self._data[flag].astype(self._flag_type).cat.codes.to_numpy()
+                for flag in flags
+            ]
+        )
 
-        for col_name in columns:
-            self._data.loc[
-                (pd.isna(self._data[f"{col_name}_flag"]))
-                | (self._data[f"{col_name}_flag"].str.contains(self._model_flag)),
-                col_name,
-            ] = np.NaN
+        # Remove values which are missing flags or model data
+        model = self._flag_type.categories.get_loc(self._model_flag)
+        self._data[columns] = self._data[columns].mask((codes == -1) | (codes == model))
 
         # Conditionally, remove flags from DataFrame
         if not self._flags:
-            self._data.drop(
-                map(lambda col_name: f"{col_name}_flag", columns), axis=1, inplace=True
-            )
+            self._data.drop(flags, axis=1, inplace=True)
 
         # Drop NaN-only rows
         self._data.dropna(how="all", subset=columns, inplace=True)
 
-    def _init_time_series(
+    def _get_inventory(
         self,
-        loc: Union[pd.DataFrame, Point, list, str],  # Station(s) or geo point
+        loc: Union[pd.DataFrame, Point, list, str],
+        stations: Union[pd.DataFrame, None] = None,
+    ) -> Union[pd.DataFrame, None]:
+        """
+        Get inventory data of the weather stations
+        """
+
+        columns = [f"{self.granularity.value}_start", f"{self.granularity.value}_end"]
+
+        if isinstance(loc, (pd.DataFrame, Point)):
+            inventory = stations if isinstance(loc, Point) else loc
+        else:
+            # Only look up inventory data if multiple chunks are required
+            if self.granularity == Granularity.HOURLY and self.chunked:
+                chunks = len(self._annual_steps)
+            else:
+                chunks = 1
+            if len(self._stations) * chunks < 2:
+                return None
+            inventory = Stations()._data
+
+        # The list of weather stations might not be available
+        if inventory.index.size == 0 or not set(columns).issubset(inventory.columns):
+            return None
+
+        return inventory[columns]
+
+    def _init_stations(
+        self,
+        loc: Union[pd.DataFrame, Point, list, str],
         start: datetime = None,
         end: datetime = None,
-        model: bool = True,  # Include model data?
-        flags: bool = False,  # Load source flags?
-    ) -> None:
+        model: bool = True,
+        id_type: str = "id",
+    ) -> Union[pd.DataFrame, None]:
         """
-        Common initialization for all time series, regardless
-        of its granularity
+        Set the list of weather stations and their inventory
         """
 
         # Set list of weather stations based on user
@@ -160,33 +256,135 @@ class TimeSeries(MeteoData):
                 loc = [loc]
             self._stations = pd.Index(loc)
 
+        # Map WMO or ICAO identifiers to Meteostat IDs
+        if id_type != "id" and not isinstance(loc, (pd.DataFrame, Point)):
+            self._stations = Stations().identify(self._stations, id_type)
+            if self._stations.hasnans:
+                warn("Skipping unknown weather station identifiers")
+                self._stations = self._stations.dropna()
+
+        # Get inventory of the weather stations
+        self._inventory = self._get_inventory(
+            loc, stations if isinstance(loc, Point) else None
+        )
+
+        # Get time zones of the weather stations
+        if getattr(self, "_timezone", None) == "local":
+            source = stations if isinstance(loc, Point) else loc
+            if not (isinstance(source, pd.DataFrame) and "timezone" in source.columns):
+                source = Stations()._data
+            self._timezones = (
+                source["timezone"].astype("object").reindex(self._stations)
+            )
+
+        return stations if isinstance(loc, Point) else None
+
+    def _localize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert UTC time data to the requested time zone
+        """
+
+        timezone = getattr(self, "_timezone", None)
+
+        if timezone is None or df.index.size == 0:
+            return df
+
+        # Use local time of each weather station
+        if timezone == "local":
+            df = localize(df, self._timezones)
+            return filter_time(df, self._start, self._end)
+
+        return localize(df, timezone)
+
+    def _load_station(self, station: str, *years) -> pd.DataFrame:
+        """
+        Load all datasets of a single weather station
+        """
+
+        if self._flags or not self._model:
+            load = self._load_data_flags
+        else:
+            load = self._load_data
+
+        frames = [load(station, year) for year in years] if years else [load(station)]
+        frames = [df for df in frames if df.index.size > 0]
+
+        return pd.concat(frames) if len(frames) > 0 else pd.DataFrame()
+
+    def _init_time_series(
+        self,
+        loc: Union[pd.DataFrame, Point, list, str],  # Station(s) or geo point
+        start: datetime = None,
+        end: datetime = None,
+        model: bool = True,  # Include model data?
+        flags: bool = False,  # Load source flags?
+        *,
+        id_type: str = "id",  # Type of station identifiers
+        lazy: bool = False,  # Only record a query plan?
+        parameters: Union[list, None] = None,  # Meteorological parameters
+    ) -> None:
+        """
+        Common initialization for all time series, regardless
+        of its granularity
+        """
+
+        # Select parameters
+        self._set_parameters(parameters)
+
+        # Defer loading until the data is requested
+        if lazy:
+            self._start = start if self._start is None else self._start
+            self._end = end if self._end is None else self._end
+            self._plan = [
+                (
+                    TimeSeries._init_time_series,
+                    (loc, start, end, model, flags),
+                    {"id_type": id_type, "parameters": parameters},
+                )
+            ]
+            return
+
+        # Set list of weather stations & their inventory
+        stations = self._init_stations(loc, start, end, model, id_type)
+
         # Preserve settings
         self._start = start if self._start is None else self._start
         self._end = end if self._end is None else self._end
         self._model = model
         self._flags = flags
 
-        # Get data for all weather stations
-        self._data = self._get_data()
-
-        # Load source flags through map file
+        # Get data for all weather stations and
+        # load source flags through map file
         # if flags are explicitly requested or
         # model data is excluded
         if flags or not model:
-            flags = self._get_flags()
-            self._data = self._data.merge(
-                flags, on=["station", "time"], how="left", suffixes=[None, "_flag"]
-            )
+            self._data = self._get_data_flags()
+        else:
+            self._data = self._get_data()
+
+        # Convert time data to the requested time zone
+        self._data = self._localize(self._data)
 
         # Remove model data from DataFrame and
         # drop flags if not specified otherwise
         if not model:
             self._filter_model()
 
+        # Store mostly empty columns as sparse arrays
+        if self.sparse:
+            self._data = sparsify(self._data, self.sparse_density)
+
         # Interpolate data spatially if requested
         # location is a geographical point
         if isinstance(loc, Point):
-            self._resolve_point(loc.method, stations, loc.alt, loc.adapt_temp)
+            self._resolve_point(
+                loc.method,
+                stations,
+                loc.alt,
+                loc.adapt_temp,
+                lapse_rates=loc.lapse_rates,
+                adapt_pres=loc.adapt_pres,
+            )
 
         # Clear cache if auto cleaning is enabled
         if self.max_age > 0 and self.autoclean:
@@ -197,8 +395,10 @@ class TimeSeries(MeteoData):
     from meteostat.series.interpolate import interpolate
     from meteostat.series.aggregate import aggregate
     from meteostat.series.convert import convert
+    from meteostat.series.pipeline import pipeline
     from meteostat.series.coverage import coverage
     from meteostat.series.count import count
     from meteostat.series.fetch import fetch
+    from meteostat.series.iter_chunks import iter_chunks
     from meteostat.series.stations import stations
     from meteostat.core.cache import clear_cache
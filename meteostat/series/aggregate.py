@@ -11,8 +11,12 @@ The code is licensed under the MIT license.
 from copy import copy
 import pandas as pd
 from meteostat.core.warn import warn
+from meteostat.utilities.aggregations import aggregate_groups
+from meteostat.utilities.helpers import deferrable
+from meteostat.utilities.mutations import densify
 
 
+@deferrable
 def aggregate(self, freq: str = None, spatial: bool = False):
     """
     Aggregate observations
@@ -28,9 +32,11 @@ def aggregate(self, freq: str = None, spatial: bool = False):
             freq = self._freq
 
         # Time aggregation
-        temp._data = temp._data.groupby(
-            ["station", pd.Grouper(level="time", freq=freq)]
-        ).agg(temp.aggregations)
+        temp._data = aggregate_groups(
+            densify(temp._data),
+            ["station", pd.Grouper(level="time", freq=freq)],
+            temp.aggregations,
+        )
 
         # Spatial aggregation
         if spatial:
@@ -41,6 +47,10 @@ def aggregate(self, freq: str = None, spatial: bool = False):
         # Round
         temp._data = temp._data.round(1)
 
+        # Restore compact data types
+        if temp.compact:
+            temp._data = temp._compact(temp._data)
+
         # Return class instance
         return temp
 
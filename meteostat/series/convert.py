@@ -9,8 +9,11 @@ The code is licensed under the MIT license.
 """
 
 from copy import copy
+from meteostat.utilities.mutations import convert_units
+from meteostat.utilities.helpers import deferrable
 
 
+@deferrable
 def convert(self, units: dict):
     """
     Convert columns to a different unit
@@ -20,9 +23,11 @@ def convert(self, units: dict):
     temp = copy(self)
 
     # Change data units
-    for parameter, unit in units.items():
-        if parameter in temp._columns:
-            temp._data[parameter] = temp._data[parameter].apply(unit)
+    temp._data = convert_units(temp._data, units, copy=not temp._owned)
+
+    # Restore compact data types
+    if temp.compact:
+        temp._data = temp._compact(temp._data)
 
     # Return class instance
     return temp
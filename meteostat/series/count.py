@@ -14,4 +14,7 @@ def count(self) -> int:
     Return number of rows in DataFrame
     """
 
+    # Execute query plan
+    self._compile()
+
     return len(self._data.index)
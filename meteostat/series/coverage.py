@@ -14,6 +14,9 @@ def coverage(self, parameter: str = None) -> float:
     Calculate data coverage (overall or by parameter)
     """
 
+    # Execute query plan
+    self._compile()
+
     if parameter is None:
         return len(self._data.index) / self.expected_rows()
 
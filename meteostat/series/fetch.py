@@ -8,21 +8,39 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
-from copy import copy
 import pandas as pd
+from meteostat.utilities.mutations import (
+    categorize_stations,
+    densify,
+    drop_levels,
+    read_only,
+)
 
 
-def fetch(self) -> pd.DataFrame:
+def fetch(self, view: bool = False) -> pd.DataFrame:
     """
-    Fetch DataFrame
+    Fetch DataFrame (or a read-only view of the data)
+
+    Views share memory with the instance. Writing to them,
+    including in-place methods like fillna(inplace=True),
+    raises a ValueError; use copy() to get a writable frame
     """
 
-    # Copy DataFrame
-    temp = copy(self._data)
+    # Execute query plan
+    self._compile()
+
+    # Copy DataFrame or create a view (with dense columns)
+    temp = densify(self._data)
+    if temp is self._data:
+        temp = read_only(temp) if view else temp.copy()
 
     # Remove station index if it's a single station
     if len(self._stations) == 1 and "station" in temp.index.names:
-        temp = temp.reset_index(level="station", drop=True)
+        temp = drop_levels(temp, "station")
+
+    # Use categorical weather station IDs
+    elif self.compact:
+        temp = categorize_stations(temp)
 
     # Return data frame
     return temp
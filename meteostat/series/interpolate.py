@@ -9,25 +9,57 @@ The code is licensed under the MIT license.
 """
 
 from copy import copy
+import numpy as np
+import pandas as pd
 from meteostat.core.warn import warn
+from meteostat.utilities.mutations import interpolate_blocks
+from meteostat.utilities.helpers import deferrable
 
 
-def interpolate(self, limit: int = 3):
+@deferrable
+def interpolate(
+    self, limit: int = 3, limit_direction: str = "both", method: str = "linear"
+):
     """
     Interpolate NULL values
     """
 
+    if method not in ("linear", "time"):
+        raise ValueError(f"Invalid interpolation method {method}")
+
+    if limit_direction not in ("forward", "backward", "both"):
+        raise ValueError(f"Invalid limit direction {limit_direction}")
+
     if self.count() > 0 and not self._data.isnull().values.all():
 
         # Create temporal instance
         temp = copy(self)
 
-        # Apply interpolation
-        temp._data = temp._data.groupby("station", group_keys=False).apply(
-            lambda group: group.interpolate(
-                method="linear", limit=limit, limit_direction="both", axis=0
-            )
+        # Arrange weather stations in contiguous blocks
+        groups, _ = pd.factorize(
+            temp._data.index.get_level_values("station"), sort=True
+        )
+        order = np.argsort(groups, kind="stable")
+
+        # Position of each row (by time or by index)
+        if method == "time":
+            x = temp._data.index.get_level_values("time").asi8[order]
+        else:
+            x = np.arange(len(temp._data.index))
+
+        # Apply interpolation & restore original order
+        columns = temp._data.select_dtypes("number").columns
+        values = temp._data[columns].to_numpy(dtype="float64", na_value=np.NaN)
+        values[order] = interpolate_blocks(
+            values[order], groups[order], x.astype("float64"), limit, limit_direction
         )
+        if not temp._owned:
+            temp._data = temp._data.copy()
+        temp._data[columns] = values
+
+        # Restore compact data types
+        if temp.compact:
+            temp._data = temp._compact(temp._data)
 
         # Return class instance
         return temp
@@ -0,0 +1,126 @@
+"""
+Iterate Over Chunks
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from copy import copy
+from typing import Iterator
+import pandas as pd
+from meteostat.core.loader import processing_iterator
+from meteostat.interface.point import Point
+
+
+def _is_spatial(step: tuple) -> bool:
+    """
+    Check if a step of the query plan combines weather stations
+    """
+
+    func, args, kwargs = step
+
+    return func.__name__ == "aggregate" and bool(
+        args[1] if len(args) > 1 else kwargs.get("spatial", False)
+    )
+
+
+def _iter_loaded(self) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over the data of each weather station (loaded instances)
+    """
+
+    if "station" not in self._data.index.names:
+        yield self.fetch()
+        return
+
+    for _, df in self._data.groupby(level="station", sort=False):
+        chunk = copy(self)
+        chunk._data = df
+        yield chunk.fetch()
+
+
+def _process_chunk(self, df: pd.DataFrame, steps: list) -> pd.DataFrame:
+    """
+    Run the query plan on the data of a single weather station
+    """
+
+    chunk = copy(self)
+    chunk._data = self._localize(df)
+    chunk._stations = df.index.get_level_values("station").unique()
+
+    # Remove model data from DataFrame
+    if not self._model:
+        chunk._filter_model()
+
+    # Run all steps of the query plan (in place)
+    chunk._owned = True
+    for func, args, kwargs in steps:
+        chunk = func(chunk, *args, **kwargs) or chunk
+
+    # Keep the station index of multi-station requests
+    chunk._stations = self._stations
+    chunk._owned = False
+
+    return chunk.fetch()
+
+
+def _iter_lazy(self, ordered: bool) -> Iterator[pd.DataFrame]:
+    """
+    Load & process one weather station at a time (lazy instances)
+    """
+
+    (_, args, kwargs), *steps = self._plan
+    loc, start, end, model, flags = args
+
+    # Create temporal instance
+    temp = copy(self)
+    temp._plan = None
+    temp._init_stations(loc, start, end, model, kwargs["id_type"])
+    temp._model = model
+    temp._flags = flags
+
+    # Group datasets by weather station
+    datasets = {}
+    for station, *year in temp._get_datasets():
+        datasets.setdefault(station, []).extend(year)
+
+    for df in processing_iterator(
+        [(station, *years) for station, years in datasets.items()],
+        temp._load_station,
+        temp.processes,
+        temp.threads,
+        ordered,
+    ):
+        yield _process_chunk(temp, df, steps)
+
+    # Clear cache if auto cleaning is enabled
+    if temp.max_age > 0 and temp.autoclean:
+        temp.clear_cache()
+
+
+def iter_chunks(self, ordered: bool = True) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over the data of each weather station
+
+    Lazy instances load one weather station at a time,
+    so that only a few chunks are kept in memory. Each
+    chunk is processed like a single-station request,
+    e.g. normalize() completes the time series of every
+    weather station.
+    """
+
+    # Geographical points are resolved at once
+    if self._plan is not None and isinstance(self._plan[0][1][0], Point):
+        self._compile()
+
+    # Data is loaded already
+    if self._plan is None:
+        return _iter_loaded(self)
+
+    if any(_is_spatial(step) for step in self._plan[1:]):
+        raise ValueError("Spatial aggregation is not available for chunks")
+
+    return _iter_lazy(self, ordered)
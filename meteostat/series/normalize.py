@@ -9,12 +9,13 @@ The code is licensed under the MIT license.
 """
 
 from copy import copy
-from numpy import NaN
 import pandas as pd
 import pytz
 from meteostat.core.warn import warn
+from meteostat.utilities.helpers import deferrable
 
 
+@deferrable
 def normalize(self):
     """
     Normalize the DataFrame
@@ -28,50 +29,43 @@ def normalize(self):
 
     if temp._start and temp._end and temp.coverage() < 1:
 
-        # Create result DataFrame
-        result = pd.DataFrame(columns=temp._columns[temp._first_met_col :])
-
-        # Handle tz-aware date ranges
-        if hasattr(temp, "_timezone") and temp._timezone is not None:
-            timezone = pytz.timezone(temp._timezone)
-            start = temp._start.astimezone(timezone)
-            end = temp._end.astimezone(timezone)
+        # Handle tz-aware date ranges (local times are naive)
+        timezone = getattr(temp, "_timezone", None)
+        if timezone == "local":
+            timezone = None
+        if timezone is not None:
+            start = temp._start.astimezone(pytz.timezone(timezone))
+            end = temp._end.astimezone(pytz.timezone(timezone))
         else:
             start = temp._start
             end = temp._end
 
-        # Go through list of weather stations
-        for station in temp._stations:
-            # Create data frame
-            df = pd.DataFrame(columns=temp._columns[temp._first_met_col :])
-            # Add time series
-            df["time"] = pd.date_range(
-                start,
-                end,
-                freq=self._freq,
-                tz=temp._timezone if hasattr(temp, "_timezone") else None,
-            )
-            # Add station ID
-            df["station"] = station
-            # Add columns
-            for column in temp._columns[temp._first_met_col :]:
-                # Add column to DataFrame
-                df[column] = NaN
+        # Full time series of each weather station
+        index = pd.MultiIndex.from_product(
+            [
+                pd.Index(temp._stations, dtype="object").unique(),
+                pd.date_range(start, end, freq=self._freq, tz=timezone),
+            ],
+            names=["station", "time"],
+        )
 
-            result = pd.concat([result, df], axis=0)
+        if temp._data.empty:
+            temp._data = pd.DataFrame(
+                index=index, columns=temp._data.columns, dtype="float64"
+            )
 
-        # Set index
-        result = result.set_index(["station", "time"])
+        else:
+            # Merge duplicate rows
+            if temp._data.index.has_duplicates:
+                temp._data = temp._data.groupby(level=index.names).first()
 
-        # Merge data
-        temp._data = (
-            pd.concat([temp._data, result], axis=0)
-            .groupby(["station", "time"], as_index=True)
-            .first()
-        )
+            # Keep existing rows outside of the time series
+            extra = temp._data.index.difference(index)
+            if len(extra) > 0:
+                index = index.append(extra)
 
-        # None -> NaN
-        temp._data = temp._data.fillna(NaN)
+            # Reindex data
+            temp._data = temp._data.reindex(index).sort_index()
 
     # Return class instance
     return temp
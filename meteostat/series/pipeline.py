@@ -0,0 +1,41 @@
+"""
+Run Multiple Operations
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from copy import copy
+
+# Operations which can be part of a pipeline
+STEPS = ("normalize", "interpolate", "aggregate", "convert")
+
+
+def pipeline(self, *steps):
+    """
+    Run a chain of operations at once, e.g.
+    pipeline("normalize", ("aggregate", "1D"))
+
+    Intermediate DataFrames are modified in place
+    """
+
+    # Create temporal instance
+    temp = copy(self)
+
+    # Add steps to query plan
+    plan = [] if self._plan is None else [*self._plan]
+    for step in steps:
+        name, *args = (step,) if isinstance(step, str) else step
+        if name not in STEPS:
+            raise ValueError(f"Invalid pipeline step {name}")
+        plan.append((getattr(type(self), name).__wrapped__, tuple(args), {}))
+    temp._plan = plan
+
+    # Lazy instances are processed on fetch()
+    if self._plan is None:
+        temp._compile()
+
+    return temp
@@ -18,5 +18,8 @@ def stations(self) -> pd.Index:
     Fetch Weather Stations
     """
 
+    # Execute query plan
+    self._compile()
+
     # Return index of weather stations
     return copy(self._stations)
@@ -6,121 +6,196 @@ Convert a Pandas Series to any meteorological data unit
 The code is licensed under the MIT license.
 """
 
-from numpy import NaN, isnan
+import numpy as np
+import pandas as pd
+
+# Wind directions (by compass sector)
+DIRECTIONS = np.array(
+    [np.NaN, "N", "NE", "E", "SE", "S", "SW", "W", "NW"], dtype=object
+)
+
+# Weather conditions (by Meteostat condition code)
+CONDITIONS = np.array(
+    [
+        np.NaN,
+        "Clear",
+        "Fair",
+        "Cloudy",
+        "Overcast",
+        "Fog",
+        "Freezing Fog",
+        "Light Rain",
+        "Rain",
+        "Heavy Rain",
+        "Freezing Rain",
+        "Heavy Freezing Rain",
+        "Sleet",
+        "Heavy Sleet",
+        "Light Snowfall",
+        "Snowfall",
+        "Heavy Snowfall",
+        "Rain Shower",
+        "Heavy Rain Shower",
+        "Sleet Shower",
+        "Heavy Sleet Shower",
+        "Snow Shower",
+        "Heavy Snow Shower",
+        "Lightning",
+        "Hail",
+        "Thunderstorm",
+        "Heavy Thunderstorm",
+        "Storm",
+    ],
+    dtype=object,
+)
+
+
+def vectorized(func):
+    """
+    Mark a unit as applicable to entire columns at once
+    """
+
+    func.vectorized = True
+
+    return func
+
+
+def _restore(value, result: np.ndarray):
+    """
+    Keep the shape & labels of the input
+    """
+
+    if isinstance(value, pd.DataFrame):
+        return pd.DataFrame(result, index=value.index, columns=value.columns)
+
+    if isinstance(value, pd.Series):
+        return pd.Series(result, index=value.index, name=value.name)
+
+    return result
+
 
+def _to_numpy(value) -> np.ndarray:
+    """
+    Get the values of the input as a float array
+    """
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.to_numpy(dtype="float64", na_value=np.NaN)
+
+    return np.asarray(value, dtype="float64")
+
+
+def _round(value, decimals: int):
+    """
+    Round values like Python's built-in round()
+    """
+
+    if np.ndim(value) == 0:
+        return round(value, decimals)
+
+    values = _to_numpy(value)
+    result = np.round(values, decimals)
+
+    # Resolve ties which are caused by scaling the binary values
+    scaled = values * 10**decimals
+    ties = scaled - np.floor(scaled) == 0.5
+    if ties.any():
+        result[ties] = [round(item, decimals) for item in values[ties].tolist()]
 
+    return _restore(value, result)
+
+
+@vectorized
 def fahrenheit(value):
     """
     Convert Celsius to Fahrenheit
     """
 
-    return round((value * 9 / 5) + 32, 1)
+    return _round((value * 9 / 5) + 32, 1)
 
 
+@vectorized
 def kelvin(value):
     """
     Convert Celsius to Kelvin
     """
 
-    return round(value + 273.15, 1)
+    return _round(value + 273.15, 1)
 
 
+@vectorized
 def inches(value):
     """
     Convert millimeters to inches
     """
 
-    return round(value / 25.4, 3)
+    return _round(value / 25.4, 3)
 
 
+@vectorized
 def feet(value):
     """
     Convert meters to feet
     """
 
-    return round(value / 0.3048, 1)
+    return _round(value / 0.3048, 1)
 
 
+@vectorized
 def ms(value):
     """
     Convert kilometers per hour to meters per second
     """
 
-    return round(value / 3.6, 1)
+    return _round(value / 3.6, 1)
 
 
+@vectorized
 def mph(value):
     """
     Convert kilometers per hour to miles per hour
     """
 
-    return round(value * 0.6214, 1)
+    return _round(value * 0.6214, 1)
 
 
+@vectorized
 def direction(value):
     """
     Convert degrees to wind direction
     """
 
-    wdir = NaN
+    deg = _to_numpy(value)
 
-    if (337 <= value <= 360) or value <= 23:
-        wdir = "N"
-    if 24 <= value <= 68:
-        wdir = "NE"
-    if 69 <= value <= 113:
-        wdir = "E"
-    if 114 <= value <= 158:
-        wdir = "SE"
-    if 159 <= value <= 203:
-        wdir = "S"
-    if 204 <= value <= 248:
-        wdir = "SW"
-    if 249 <= value <= 293:
-        wdir = "W"
-    if 294 <= value <= 336:
-        wdir = "NW"
+    index = np.select(
+        [
+            ((337 <= deg) & (deg <= 360)) | (deg <= 23),
+            (24 <= deg) & (deg <= 68),
+            (69 <= deg) & (deg <= 113),
+            (114 <= deg) & (deg <= 158),
+            (159 <= deg) & (deg <= 203),
+            (204 <= deg) & (deg <= 248),
+            (249 <= deg) & (deg <= 293),
+            (294 <= deg) & (deg <= 336),
+        ],
+        np.arange(1, 9),
+        0,
+    )
 
-    return wdir
+    return _restore(value, DIRECTIONS[index])
 
 
+@vectorized
 def condition(value):
     """
     Convert Meteostat condition code to descriptive string
     """
 
-    if isnan(value) or value < 1 or value > 27:
-        return NaN
+    code = _to_numpy(value)
 
-    return [
-        "Clear",
-        "Fair",
-        "Cloudy",
-        "Overcast",
-        "Fog",
-        "Freezing Fog",
-        "Light Rain",
-        "Rain",
-        "Heavy Rain",
-        "Freezing Rain",
-        "Heavy Freezing Rain",
-        "Sleet",
-        "Heavy Sleet",
-        "Light Snowfall",
-        "Snowfall",
-        "Heavy Snowfall",
-        "Rain Shower",
-        "Heavy Rain Shower",
-        "Sleet Shower",
-        "Heavy Sleet Shower",
-        "Snow Shower",
-        "Heavy Snow Shower",
-        "Lightning",
-        "Hail",
-        "Thunderstorm",
-        "Heavy Thunderstorm",
-        "Storm",
-    ][int(value) - 1]
+    index = np.where((code >= 1) & (code <= 27), code, 0).astype("int64")
+
+    return _restore(value, CONDITIONS[index])
 
 
 # Imperial units
@@ -17,7 +17,8 @@ def weighted_average(step: pd.DataFrame) -> pd.DataFrame:
     Calculate weighted average from grouped data
     """
 
-    data = np.ma.masked_array(step, np.isnan(step))
+    values = step.to_numpy(dtype="float64", na_value=np.NaN)
+    data = np.ma.masked_array(values, np.isnan(values))
     data = np.ma.average(data, axis=0, weights=data[:, -2])
     data = data.filled(np.NaN)
 
@@ -35,3 +36,59 @@ def degree_mean(data: pd.Series) -> float:
     rads = np.deg2rad(data)
     sums = np.arctan2(np.sum(np.sin(rads)), np.sum(np.cos(rads)))
     return (np.rad2deg(sums) + 360) % 360
+
+
+def aggregate_groups(df: pd.DataFrame, by: list, aggregations: dict) -> pd.DataFrame:
+    """
+    Aggregate grouped data using native groupby
+    reductions wherever possible
+    """
+
+    groups = df.groupby(by)
+    result = []
+
+    # Collect columns by aggregation function
+    functions = {}
+    for col, func in aggregations.items():
+        functions.setdefault(func, []).append(col)
+
+    for func, columns in functions.items():
+        # Circular mean from grouped sums of the vector components
+        if func is degree_mean:
+            rads = np.deg2rad(df[columns].astype("float64"))
+            sin = np.sin(rads).groupby(by).sum(min_count=1)
+            cos = np.cos(rads).groupby(by).sum(min_count=1)
+            result.append((np.rad2deg(np.arctan2(sin, cos)) + 360) % 360)
+
+        # Built-in reductions & other functions
+        else:
+            result.append(groups[columns].agg(func))
+
+    return pd.concat(result, axis=1)[list(aggregations)]
+
+
+def coalesce(df: pd.DataFrame, stations: pd.Index) -> pd.DataFrame:
+    """
+    Fill each value from the first weather station
+    (in order of priority) which provides it
+    """
+
+    # Align station series on a common index
+    data = df.unstack("station")
+
+    # Create result DataFrame
+    result = pd.DataFrame(index=data.index)
+
+    for col in df.columns:
+        # Get values of all stations sorted by priority
+        values = data[col].reindex(columns=stations).to_numpy()
+
+        # Position of the first available value per row
+        first = pd.notna(values).argmax(axis=1)
+
+        # Take values & restore data type
+        result[col] = pd.array(
+            values[np.arange(len(first)), first], dtype=df[col].dtype
+        )
+
+    return result
@@ -8,7 +8,12 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
+from copy import copy
+from datetime import datetime
+from functools import wraps
+from typing import Union
 import numpy as np
+import pandas as pd
 
 
 def get_distance(lat1, lon1, lat2, lon2) -> float:
@@ -30,3 +35,75 @@ def get_distance(lat1, lon1, lat2, lon2) -> float:
     arch_sin = 2 * np.arcsin(np.sqrt(arch))
 
     return radius * arch_sin
+
+
+def to_datetime64(
+    value: Union[datetime, None], default: np.datetime64
+) -> np.datetime64:
+    """
+    Convert a (time zone aware) date to a naive UTC datetime64
+    """
+
+    if value is None:
+        return default.astype("datetime64[ns]")
+
+    value = pd.Timestamp(value)
+
+    if value.tzinfo is not None:
+        value = value.tz_convert(None)
+
+    return value.to_datetime64()
+
+
+def deferrable(func):
+    """
+    Record a method call in the query plan of
+    lazy instances instead of executing it
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._plan is None:
+            return func(self, *args, **kwargs)
+
+        # Create temporal instance
+        temp = copy(self)
+
+        # Add step to query plan
+        temp._plan = [*self._plan, (func, args, kwargs)]
+
+        return temp
+
+    return wrapper
+
+
+def _is_conversion(step: tuple) -> bool:
+    """
+    Check if a step of a query plan is a plain unit conversion
+    """
+
+    func, args, kwargs = step
+
+    return func.__name__ == "convert" and len(args) == 1 and not kwargs
+
+
+def fuse_steps(plan: list) -> list:
+    """
+    Merge consecutive unit conversions of different
+    columns into a single step of a query plan
+    """
+
+    steps = []
+
+    for step in plan:
+        if (
+            steps
+            and _is_conversion(steps[-1])
+            and _is_conversion(step)
+            and not set(step[1][0]) & set(steps[-1][1][0])
+        ):
+            steps[-1] = (step[0], ({**steps[-1][1][0], **step[1][0]},), {})
+        else:
+            steps.append(step)
+
+    return steps
@@ -12,14 +12,57 @@ from datetime import datetime
 from typing import Union
 import numpy as np
 import pandas as pd
+from meteostat.core.warn import warn
 
+# Default temperature difference by 100 meters
+LAPSE_RATES = {"temp": 0.6, "dwpt": 0.6, "tavg": 0.6, "tmin": 0.6, "tmax": 0.6}
 
-def localize(df: pd.DataFrame, timezone: str) -> pd.DataFrame:
+
+def localize(df: pd.DataFrame, timezone: Union[str, pd.Series]) -> pd.DataFrame:
     """
-    Convert time data to any time zone
+    Convert UTC time data to any time zone or to the
+    local time of each weather station (station -> time zone)
     """
 
-    return df.tz_localize("UTC", level="time").tz_convert(timezone, level="time")
+    index = df.index
+
+    # Convert the unique time values only
+    if isinstance(timezone, str):
+        level = index.levels[index.names.index("time")]
+        index = index.set_levels(
+            level.tz_localize("UTC").tz_convert(timezone), level="time"
+        )
+        return df.set_axis(index, axis=0, copy=False)
+
+    # Time zone of each row
+    codes, stations = pd.factorize(index.get_level_values("station"))
+    zones = timezone.reindex(stations).to_numpy(dtype="object")[codes]
+
+    # Convert rows by time zone (local wall-clock time)
+    time = index.get_level_values("time")
+    values = time.asi8.copy()
+    for zone in pd.unique(zones[pd.notna(zones)]):
+        rows = zones == zone
+        values[rows] = (
+            time[rows].tz_localize("UTC").tz_convert(zone).tz_localize(None).asi8
+        )
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.DatetimeIndex(values, name="time")
+            if name == "time"
+            else index.get_level_values(name)
+            for name in index.names
+        ]
+    )
+    df = df.set_axis(index, axis=0, copy=False)
+
+    # Keep the first of repeated hours at the end of daylight saving time
+    if index.has_duplicates:
+        warn("Dropping repeated local hours at the end of daylight saving time")
+        df = df[~index.duplicated()]
+
+    return df
 
 
 def filter_time(
@@ -28,32 +71,323 @@ def filter_time(
     end: Union[datetime, None] = None,
 ) -> pd.DataFrame:
     """
-    Filter time series data based on start and end date
+    Filter time series data based on start and/or end date
     """
 
+    if start is None and end is None:
+        return df
+
     # Get time index
     time = df.index.get_level_values("time")
 
+    # Use binary search on sorted time series
+    if time.is_monotonic_increasing:
+        first = 0 if start is None else time.searchsorted(start, side="left")
+        last = len(time) if end is None else time.searchsorted(end, side="right")
+        return df.iloc[first:last]
+
     # Filter & return
-    return df.loc[(time >= start) & (time <= end)] if start and end else df
+    mask = np.ones(len(time), dtype=bool)
+    if start is not None:
+        mask &= time >= start
+    if end is not None:
+        mask &= time <= end
+
+    return df.loc[mask]
+
+
+def get_lapse_rates(
+    lapse_rates: dict, columns: list, months: Union[np.ndarray, None] = None
+) -> np.ndarray:
+    """
+    Get the lapse rates of multiple columns (by month if seasonal)
+    """
+
+    rates = [np.asarray(lapse_rates[col], dtype="float64") for col in columns]
+
+    # Seasonal lapse rates contain one value per month
+    if months is not None and any(rate.ndim > 0 for rate in rates):
+        return np.column_stack(
+            [
+                rate[months - 1] if rate.ndim > 0 else np.full(months.size, rate)
+                for rate in rates
+            ]
+        )
+
+    return np.array(rates)
+
+
+def get_months(df: pd.DataFrame) -> np.ndarray:
+    """
+    Get the month of each row
+    """
+
+    if "month" in df.index.names:
+        return df.index.get_level_values("month").to_numpy()
 
+    return df.index.get_level_values("time").month.to_numpy()
 
-def adjust_temp(df: pd.DataFrame, alt: int):
+
+def reduce_pres(alt: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Get the factor which reduces sea-level pressure
+    to the given altitude (barometric formula)
+    """
+
+    return (1 - 0.0065 * np.asarray(alt, dtype="float64") / 288.15) ** 5.255
+
+
+def adjust_temp(
+    df: pd.DataFrame,
+    alt: int,
+    lapse_rates: Union[dict, None] = None,
+    adjust_pres: bool = False,
+):
     """
     Adjust temperature-like data based on altitude
     """
 
-    # Default temperature difference by 100 meters
-    temp_diff = 0.6
+    # Use default lapse rates
+    if lapse_rates is None:
+        lapse_rates = LAPSE_RATES
 
     # Temperature-like columns
-    temp_like = ("temp", "dwpt", "tavg", "tmin", "tmax")
+    columns = [col for col in lapse_rates if col in df.columns]
 
     # Adjust values for all temperature-like data
-    for col_name in temp_like:
-        if col_name in df.columns:
-            df.loc[df[col_name] != np.NaN, col_name] = df[col_name] + (
-                temp_diff * ((df["elevation"] - alt) / 100)
-            )
+    if len(columns) > 0:
+        # Altitude difference in 100 meters
+        diff = (df["elevation"].to_numpy(dtype="float64") - alt) / 100
+
+        # Lapse rates (by month, if seasonal)
+        rates = get_lapse_rates(
+            lapse_rates,
+            columns,
+            get_months(df)
+            if any(np.ndim(lapse_rates[col]) > 0 for col in columns)
+            else None,
+        )
+
+        values = df[columns].to_numpy(dtype="float64")
+        values += rates * diff[:, None]
+        df[columns] = values
+
+    # Reduce sea-level pressure to the target altitude
+    if adjust_pres and "pres" in df.columns:
+        df["pres"] *= reduce_pres(alt)
 
     return df
+
+
+def _get_neighbours(valid: np.ndarray, groups: np.ndarray) -> tuple:
+    """
+    Get the previous & next valid row of each value within
+    its block and whether they exist (rows x columns)
+    """
+
+    rows = np.arange(len(valid))
+
+    # First & last row of each block
+    boundary = np.r_[True, groups[1:] != groups[:-1]]
+    first = np.maximum.accumulate(np.where(boundary, rows, 0))
+    last = np.minimum.accumulate(
+        np.where(np.r_[boundary[1:], True], rows, rows.size)[::-1]
+    )[::-1]
+
+    # Previous & next valid row
+    prev = np.maximum.accumulate(np.where(valid, rows[:, None], -1), axis=0)
+    after = np.minimum.accumulate(
+        np.where(valid, rows[:, None], rows.size)[::-1], axis=0
+    )[::-1]
+
+    # Block boundaries act as barriers
+    return prev, after, prev >= first[:, None], after <= last[:, None]
+
+
+def _get_fill_mask(
+    valid: np.ndarray,
+    neighbours: tuple,
+    limit: Union[int, None],
+    limit_direction: str,
+) -> np.ndarray:
+    """
+    Get the NaN values which are within the gap limit
+    """
+
+    prev, after, has_prev, has_next = neighbours
+    rows = np.arange(len(valid))[:, None]
+
+    if limit is None:
+        limit = len(valid)
+    forward = has_prev & (rows - prev <= limit)
+    backward = has_next & (after - rows <= limit)
+
+    if limit_direction == "forward":
+        return ~valid & forward
+    if limit_direction == "backward":
+        return ~valid & backward
+
+    return ~valid & (forward | backward)
+
+
+def _get_edges(neighbours: tuple, size: int) -> tuple:
+    """
+    Get the rows to interpolate between, using the
+    nearest valid value at the edges of a block
+    """
+
+    prev, after, has_prev, has_next = neighbours
+    left = np.clip(np.where(has_prev, prev, after), 0, size - 1)
+    right = np.clip(np.where(has_next, after, prev), 0, size - 1)
+
+    return left, right
+
+
+def interpolate_blocks(
+    values: np.ndarray,
+    groups: np.ndarray,
+    x: np.ndarray,
+    limit: Union[int, None] = None,
+    limit_direction: str = "both",
+) -> np.ndarray:
+    """
+    Interpolate NaN values of a 2D array within
+    contiguous blocks of rows (e.g. weather stations)
+    """
+
+    values = np.array(values, dtype="float64")
+
+    if len(values) == 0:
+        return values
+
+    valid = ~np.isnan(values)
+    neighbours = _get_neighbours(valid, groups)
+    fill = _get_fill_mask(valid, neighbours, limit, limit_direction)
+    left, right = _get_edges(neighbours, len(values))
+
+    y_left = np.take_along_axis(values, left, axis=0)
+    y_right = np.take_along_axis(values, right, axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = np.where(
+            x[right] != x[left], (y_right - y_left) / (x[right] - x[left]), 0
+        )
+
+    values[fill] = (slope * (x[:, None] - x[left]) + y_left)[fill]
+
+    return values
+
+
+def convert_units(df: pd.DataFrame, units: dict, copy: bool = True) -> pd.DataFrame:
+    """
+    Convert columns to different units
+    (one batch per conversion function)
+    """
+
+    if copy:
+        df = df.copy()
+
+    # Collect columns by conversion function
+    functions = {}
+    for parameter, unit in units.items():
+        if parameter in df.columns:
+            functions.setdefault(unit, []).append(parameter)
+
+    for unit, columns in functions.items():
+        # Convert all columns at once
+        if getattr(unit, "vectorized", False):
+            df[columns] = unit(df[columns])
+
+        # Convert element by element
+        else:
+            for col in columns:
+                df[col] = df[col].apply(unit)
+
+    return df
+
+
+def categorize_stations(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the weather station level of the index as categorical
+    """
+
+    if not isinstance(df.index, pd.MultiIndex) or "station" not in df.index.names:
+        return df
+
+    level = df.index.names.index("station")
+
+    return df.set_axis(
+        df.index.set_levels(
+            pd.CategoricalIndex(df.index.levels[level]), level="station"
+        ),
+        axis=0,
+        copy=False,
+    )
+
+
+def drop_levels(df: pd.DataFrame, levels: Union[str, list]) -> pd.DataFrame:
+    """
+    Remove index levels without copying the data
+    """
+
+    return df.set_axis(df.index.droplevel(levels), axis=0, copy=False)
+
+
+def read_only(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get a read-only view of a DataFrame
+    (columns of extension types are copied)
+    """
+
+    data = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, np.dtype):
+            # Lock a new view of the column's buffer
+            values = df[col].to_numpy().view()
+            values.flags.writeable = False
+        else:
+            values = df[col].array.copy()
+        data[col] = values
+
+    return pd.DataFrame(data, index=df.index, columns=df.columns, copy=False)
+
+
+def sparsify(
+    df: pd.DataFrame, density: Union[float, None], columns: tuple = ()
+) -> pd.DataFrame:
+    """
+    Store mostly empty float columns (and the given
+    columns) as sparse arrays (density None = only
+    the given columns)
+    """
+
+    types = {
+        col: pd.SparseDtype(dtype, np.NaN)
+        for col, dtype in df.dtypes.items()
+        if pd.api.types.is_float_dtype(dtype)
+        and not isinstance(dtype, pd.SparseDtype)
+        and (
+            col in columns
+            or (
+                density is not None
+                and len(df.index) > 0
+                and df[col].count() <= density * len(df.index)
+            )
+        )
+    }
+
+    return df.astype(types) if types else df
+
+
+def densify(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert sparse columns to regular (dense) columns
+    """
+
+    types = {
+        col: dtype.subtype
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.SparseDtype)
+    }
+
+    return df.astype(types) if types else df
@@ -8,7 +8,12 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
-from meteostat.core.cache import get_local_file_path
+from meteostat.core.cache import (
+    get_local_file_path,
+    file_in_cache,
+    get_missing_file_path,
+    mark_missing,
+)
 
 
 EXPECTED_FILE_PATH = "cache/hourly/6dfc35c47756e962ef055d1049f1f8ec"
@@ -28,3 +33,16 @@ def test_get_local_file_path_chunked():
     """
 
     assert get_local_file_path("cache", "hourly", "10101_2022") != EXPECTED_FILE_PATH
+
+
+def test_mark_missing(tmp_path):
+    """
+    Test missing file marker
+    """
+
+    path = str(tmp_path / EXPECTED_FILE_PATH)
+    file_in_cache(path)
+    mark_missing(path)
+
+    assert file_in_cache(get_missing_file_path(path), 60)
+    assert not file_in_cache(path, 60)
@@ -0,0 +1,81 @@
+"""
+Loader Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from urllib.error import HTTPError
+import pytest
+import pandas as pd
+from meteostat.core.cache import get_missing_file_path
+from meteostat.core.loader import load_handler, processing_iterator
+
+
+def load(size: int) -> pd.DataFrame:
+    """
+    Create a DataFrame with a given number of rows
+    """
+
+    return pd.DataFrame({"temp": range(size)})
+
+
+def test_processing_iterator():
+    """
+    Test yielding of non-empty DataFrames
+    """
+
+    datasets = [(3,), (0,), (2,), (1,)]
+
+    ordered = list(processing_iterator(datasets, load, 1, 2))
+    unordered = list(processing_iterator(datasets, load, 1, 2, False))
+
+    assert [len(df) for df in ordered] == [3, 2, 1]
+    assert sorted(len(df) for df in unordered) == [1, 2, 3]
+
+
+def test_load_handler_missing(tmp_path):
+    """
+    Test marking of missing files
+    """
+
+    path = str(tmp_path / "cache")
+    with pytest.warns(Warning):
+        df = load_handler(
+            f"{tmp_path}/",
+            "foo.csv.gz",
+            ["temp"],
+            {"temp": "float64"},
+            [],
+            missing_path=path,
+        )
+
+    assert df.empty
+    assert (tmp_path / get_missing_file_path("cache")).is_file()
+
+
+def test_load_handler_error(tmp_path, monkeypatch):
+    """
+    Test that temporary errors are not marked as missing files
+    """
+
+    def read_csv(url, **_):
+        raise HTTPError(url, 503, "Service Unavailable", None, None)
+
+    monkeypatch.setattr(pd, "read_csv", read_csv)
+    path = str(tmp_path / "cache")
+    with pytest.warns(Warning):
+        df = load_handler(
+            f"{tmp_path}/",
+            "foo.csv.gz",
+            ["temp"],
+            {"temp": "float64"},
+            [],
+            missing_path=path,
+        )
+
+    assert df.empty
+    assert not (tmp_path / get_missing_file_path("cache")).exists()
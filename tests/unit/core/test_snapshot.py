@@ -0,0 +1,48 @@
+"""
+Snapshot Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+from meteostat.core.snapshot import save_snapshot, load_snapshot
+
+
+def test_snapshot(tmp_path):
+    """
+    Test snapshot round trip
+    """
+
+    df = pd.DataFrame(
+        {
+            "name": ["Frankfurt", None],
+            "country": pd.Categorical(["DE", "DE"]),
+            "icao": pd.array(["EDDF", None], dtype="string"),
+            "latitude": [50.05, -33.9461],
+            "daily_start": pd.to_datetime(["1934-01-01", None]),
+        },
+        index=pd.Index(["10637", "94767"], name="id"),
+    )
+
+    save_snapshot(df, tmp_path / "stations", {"latitude": 4})
+    result = load_snapshot(tmp_path / "stations")
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_snapshot_precision(tmp_path):
+    """
+    Test snapshot of floats without decimals
+    """
+
+    df = pd.DataFrame({"latitude": [50.05]}, index=pd.Index(["10637"], name="id"))
+
+    save_snapshot(df, tmp_path / "stations")
+    result = load_snapshot(tmp_path / "stations")
+
+    assert np.isclose(result["latitude"].iloc[0], 50.05)
@@ -0,0 +1,123 @@
+"""
+Grid Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+from meteostat import Grid, Hourly
+
+
+STATIONS = pd.DataFrame(
+    {
+        "latitude": [50.0, 50.1, 60.0],
+        "longitude": [8.5, 8.5, 8.5],
+        "elevation": [100.0, 200.0, 100.0],
+    },
+    index=pd.Index(["10637", "10635", "01001"], name="id"),
+)
+
+
+def test_weights():
+    """
+    Test: Only weather stations within the radius get weights
+    """
+
+    grid = Grid([50.0, 50.1], [8.5], 100)
+    grid._set_weights(STATIONS)
+
+    assert grid.stations.tolist() == ["10637", "10635"]
+    assert (grid._weights["weight"] > 0).sum() == 4
+
+
+def test_apply():
+    """
+    Test: Apply weights to all time steps
+    """
+
+    grid = Grid([50.05], [8.5])
+    grid._set_weights(STATIONS)
+
+    values = np.array([[10.0, 20.0], [10.0, np.NaN]])
+    values = values[:, [grid.stations.get_loc("10637"), grid.stations.get_loc("10635")]]
+    result = grid._apply(values)
+
+    assert np.allclose(result[:, 0], [15.0, 10.0])
+
+
+def test_interpolate_coco():
+    """
+    Test: Use the nearest weather station for weather condition codes
+    """
+
+    grid = Grid([50.02], [8.5])
+    grid._set_weights(STATIONS)
+
+    data = Hourly.__new__(Hourly)
+    data._stations = pd.Index(["10637", "10635"])
+    data._data = pd.DataFrame(
+        {"temp": [10.0, 20.0], "coco": [3.0, 8.0]},
+        index=pd.MultiIndex.from_product(
+            [["10637", "10635"], pd.to_datetime(["2022-01-01"])],
+            names=["station", "time"],
+        ),
+    )
+
+    result = grid.interpolate(data)
+
+    assert result["coco"].ravel().tolist() == [3.0]
+    assert 10.0 < result["temp"].ravel()[0] < 15.0
+
+
+def test_interpolate_pres():
+    """
+    Test: Reduce sea-level pressure to the altitude of each cell
+    """
+
+    grid = Grid([50.0], [8.5], 1000)
+    grid.alt_range = None
+    grid.adapt_pres = True
+    grid._set_weights(STATIONS)
+
+    data = Hourly.__new__(Hourly)
+    data._stations = grid.stations
+    data._data = pd.DataFrame(
+        {"pres": [1000.0] * len(grid.stations)},
+        index=pd.MultiIndex.from_product(
+            [grid.stations, pd.to_datetime(["2022-01-01"])],
+            names=["station", "time"],
+        ),
+    )
+
+    result = grid.interpolate(data)
+
+    assert round(result["pres"].ravel()[0]) == 887
+
+
+def test_no_stations():
+    """
+    Test: Return an empty field if no weather station is close enough
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._stations = pd.Index(["10637", "10635"])
+    data._data = pd.DataFrame(
+        {"temp": [10.0, 20.0]},
+        index=pd.MultiIndex.from_product(
+            [["10637", "10635"], pd.to_datetime(["2022-01-01"])],
+            names=["station", "time"],
+        ),
+    )
+
+    for alt in (100, None):
+        grid = Grid([40.0], [8.5], alt)
+        grid._set_weights(STATIONS)
+        result = grid.interpolate(data)
+
+        assert grid.stations.empty
+        assert np.isnan(result["temp"]).all()
@@ -0,0 +1,34 @@
+"""
+Normals Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import pandas as pd
+from meteostat import Normals
+
+
+def test_normalize():
+    """
+    Test: Complete the months of each weather station & period
+    """
+
+    data = Normals.__new__(Normals)
+    data._stations = pd.Index(["10637", "10635"])
+    data._data = pd.DataFrame(
+        {"tmin": [1.0, 2.0]},
+        index=pd.MultiIndex.from_tuples(
+            [("10637", 1961, 1990, 1), ("10637", 1991, 2020, 7)],
+            names=["station", "start", "end", "month"],
+        ),
+    )
+
+    df = data.normalize()._data
+
+    assert len(df.index) == 24
+    assert df["tmin"].count() == 2
+    assert df.loc[("10637", 1991, 2020, 7), "tmin"] == 2.0
@@ -0,0 +1,103 @@
+"""
+Stations Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from datetime import datetime
+import pandas as pd
+from meteostat import Stations
+
+
+def get_stations() -> Stations:
+    """
+    Create a Stations instance from a small table
+    """
+
+    stations = Stations.__new__(Stations)
+    stations._data = pd.DataFrame(
+        {
+            "name": ["Frankfurt", "Offenbach", "Vancouver"],
+            "country": ["DE", "DE", "CA"],
+            "region": ["HE", "HE", "BC"],
+            "latitude": [50.05, 50.1, 49.2],
+            "longitude": [8.6, 8.78, -123.18],
+            "elevation": [111.0, 119.0, 4.0],
+            "timezone": ["Europe/Berlin", "Europe/Berlin", "America/Vancouver"],
+            "hourly_start": pd.to_datetime(["2010-01-01", None, "2000-01-01"]),
+            "hourly_end": pd.to_datetime(["2022-12-31", None, "2015-12-31"]),
+        },
+        index=pd.Index(["10637", "10641", "71892"], dtype="string", name="id"),
+    ).astype({"country": "category", "region": "category", "timezone": "category"})
+
+    return stations
+
+
+def test_fetch_types():
+    """
+    Test: Return categorical columns as strings
+    """
+
+    df = get_stations().region("DE").fetch()
+
+    assert df.index.tolist() == ["10637", "10641"]
+    assert df["country"].dtype == "string"
+    assert df["timezone"].dtype == "string"
+    assert df["region"].str.lower().tolist() == ["he", "he"]
+
+
+def test_compile():
+    """
+    Test: Evaluate expensive filters on the selected weather stations only
+    """
+
+    calls = []
+
+    def predicate(df, rows):
+        calls.append((df.index.tolist(), rows.tolist()))
+        return df["elevation"] > 115
+
+    stations = get_stations()._filter(predicate, 2).region("DE")
+
+    assert stations.fetch().index.tolist() == ["10641"]
+    assert calls == [(["10637", "10641"], [0, 1])]
+
+
+def test_availability():
+    """
+    Test: Check which selected weather stations cover each period
+    """
+
+    stations = get_stations()
+    stations.max_age = 0
+    df = stations.region("DE").availability(
+        "hourly",
+        [
+            (datetime(2012, 1, 1), datetime(2012, 12, 31)),
+            (datetime(2005, 1, 1), datetime(2012, 12, 31)),
+        ],
+    )
+
+    assert df.columns.tolist() == ["10637", "10641"]
+    assert df.to_numpy().tolist() == [[True, False], [False, False]]
+    assert stations.inventory(
+        "hourly", (datetime(2001, 1, 1), datetime(2014, 1, 1))
+    ).fetch().index.tolist() == ["71892"]
+
+
+def test_lookup():
+    """
+    Test: Get weather stations by WMO identifiers
+    """
+
+    stations = get_stations()
+    stations._data["wmo"] = pd.array(["10637", None, "71892"], dtype="string")
+    stations._indexes = {}
+    df = stations.lookup(["71892", "00000"])
+
+    assert df.index.tolist() == ["71892"]
+    assert df["country"].dtype == "string"
@@ -0,0 +1,301 @@
+"""
+TimeSeries Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from datetime import datetime
+import pytest
+import numpy as np
+import pandas as pd
+from meteostat import Hourly, Stations, units
+from meteostat.series.iter_chunks import _process_chunk
+from meteostat.utilities.mutations import categorize_stations
+
+
+def test_get_datasets():
+    """
+    Test: Skip chunks which are not covered by the inventory
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._set_time(datetime(2018, 1, 1), datetime(2020, 12, 31, 23, 59))
+    data._stations = pd.Index(["10637", "10635", "D1424", "99999"])
+    data._model = False
+    data._inventory = pd.DataFrame(
+        {
+            "hourly_start": pd.to_datetime(["2019-06-01", "2017-01-01", None]),
+            "hourly_end": pd.to_datetime(["2020-12-31", "2018-03-01", None]),
+        },
+        index=pd.Index(["10637", "10635", "D1424"], name="id"),
+    )
+
+    # Weather stations which are not in the inventory are loaded completely
+    assert data._get_datasets() == [
+        ("10637", 2019),
+        ("10637", 2020),
+        ("10635", 2018),
+        ("99999", 2018),
+        ("99999", 2019),
+        ("99999", 2020),
+    ]
+
+
+def test_get_inventory(tmp_path, monkeypatch):
+    """
+    Test: Skip the inventory if the list of weather stations is not available
+    """
+
+    monkeypatch.setattr(Stations, "endpoint", f"{tmp_path}/")
+    monkeypatch.setattr(Stations, "max_age", 0)
+
+    data = Hourly.__new__(Hourly)
+    data._set_time(datetime(2022, 1, 1), datetime(2022, 1, 2))
+    data._stations = pd.Index(["10637", "99999"])
+
+    with pytest.warns(Warning):
+        assert data._get_inventory(["10637", "99999"]) is None
+
+
+def test_lazy():
+    """
+    Test: Record a query plan without loading data
+    """
+
+    data = Hourly(
+        "10637", datetime(2018, 1, 1), datetime(2018, 1, 31, 23, 59), lazy=True
+    )
+    query = data.normalize().aggregate("1D")
+
+    assert data._data.empty
+    assert len(data._plan) == 1
+    assert [step[0].__name__ for step in query._plan[1:]] == ["normalize", "aggregate"]
+
+
+def test_set_parameters():
+    """
+    Test: Select meteorological parameters
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._set_parameters(["prcp", "temp"])
+
+    assert list(data._types) == ["temp", "prcp"]
+    assert list(data.aggregations) == ["temp", "prcp"]
+    assert data._get_usecols() == ["date", "hour", "temp", "prcp"]
+    assert len(Hourly._types) == 11
+
+    with pytest.raises(ValueError):
+        data._set_parameters(["foo"])
+
+
+def test_compact():
+    """
+    Test: Convert data to the compact schema
+    """
+
+    data = Hourly.__new__(Hourly)
+    df = pd.DataFrame(
+        {"temp": [1.5, np.NaN], "rhum": [80.0, np.NaN], "coco": [3.0, 5.0]},
+        index=pd.MultiIndex.from_tuples(
+            [("10637", "2022-01-01"), ("10635", "2022-01-01")],
+            names=["station", "time"],
+        ),
+    )
+
+    result = data._compact(df)
+
+    assert result.dtypes.astype(str).tolist() == ["float32", "Int16", "Int8"]
+    assert pd.isna(result["rhum"].iloc[1])
+    assert categorize_stations(result).index.levels[0].dtype == "category"
+    assert df["temp"].dtype == "float64"
+
+    # Keep compact data types after unit conversions
+    data.compact = True
+    data._data = result
+    result = data.convert(units.imperial)._data
+
+    assert result.dtypes.astype(str).tolist() == ["float32", "Int16", "Int8"]
+
+
+def test_compact_interpolate():
+    """
+    Test: Keep integer columns of the compact schema after interpolation
+    """
+
+    data = Hourly.__new__(Hourly)
+    data.compact = True
+    data._data = pd.DataFrame(
+        {
+            "rhum": pd.array([80, None, 90], dtype="Int16"),
+            "wdir": pd.array([200, None, 210], dtype="Int16"),
+        },
+        index=pd.MultiIndex.from_product(
+            [["10637"], pd.date_range("2022-01-01", periods=3, freq="H")],
+            names=["station", "time"],
+        ),
+    )
+
+    result = data.interpolate()._data
+
+    assert result.dtypes.astype(str).tolist() == ["Int16", "Int16"]
+    assert result["rhum"].tolist() == [80, 85, 90]
+    assert result["wdir"].tolist() == [200, 205, 210]
+
+
+def test_encode_flags():
+    """
+    Test: Encode unknown source flags explicitly
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._set_parameters(["temp"])
+    data._model = False
+    data._flags = True
+    flags = pd.DataFrame({"temp": ["A", "E", "AB", "CE", None]})
+
+    with pytest.warns(Warning):
+        flags = data._encode_flags(flags)
+
+    assert flags["temp"].dtype == data._flag_type
+    assert flags["temp"].tolist()[:4] == ["A", "E", "?", "E"]
+
+    # Only keep values which are not model data or missing flags
+    data._data = pd.DataFrame({"temp": [1.0, 2.0, 3.0, 4.0, 5.0]}).join(
+        flags, rsuffix="_flag"
+    )
+    data._filter_model()
+
+    assert data._data["temp"].tolist() == [1.0, 3.0]
+
+
+def test_pipeline():
+    """
+    Test: Add a chain of operations to the query plan
+    """
+
+    data = Hourly(
+        "10637", datetime(2018, 1, 1), datetime(2018, 1, 31, 23, 59), lazy=True
+    )
+    query = data.pipeline("normalize", ("aggregate", "1D"))
+
+    assert [step[0].__name__ for step in query._plan[1:]] == ["normalize", "aggregate"]
+    assert query._plan[2][1] == ("1D",)
+
+    with pytest.raises(ValueError):
+        data.pipeline("fetch")
+
+
+def test_resolve_point_parameters():
+    """
+    Test: Weighted point interpolation without wind direction
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._set_parameters(["temp"])
+    data._stations = pd.Index(["10637", "10635"])
+    data._data = pd.DataFrame(
+        {"temp": [1.0, 3.0]},
+        index=pd.MultiIndex.from_tuples(
+            [
+                ("10637", pd.Timestamp("2022-01-01")),
+                ("10635", pd.Timestamp("2022-01-01")),
+            ],
+            names=["station", "time"],
+        ),
+    )
+    stations = pd.DataFrame(
+        {"score": [1.0, 1.0], "elevation": [100.0, 100.0]},
+        index=pd.Index(["10637", "10635"], name="id"),
+    )
+
+    data._resolve_point("weighted", stations, 100, False)
+
+    assert data._data.columns.tolist() == ["temp"]
+    assert data._data["temp"].iloc[0] == 2.0
+
+
+def test_iter_chunks():
+    """
+    Test: Process chunks like single-station requests
+    """
+
+    data = Hourly(
+        ["10637", "10635"],
+        datetime(2022, 1, 1),
+        datetime(2022, 1, 1, 23, 59),
+        lazy=True,
+    )
+    df = pd.DataFrame(
+        {"temp": [1.0]},
+        index=pd.MultiIndex.from_tuples(
+            [("10637", pd.Timestamp("2022-01-01 12:00"))], names=["station", "time"]
+        ),
+    )
+
+    with pytest.raises(ValueError):
+        data.aggregate("1D", True).iter_chunks()
+
+    temp = Hourly.__new__(Hourly)
+    temp._set_time(datetime(2022, 1, 1), datetime(2022, 1, 1, 23, 59))
+    temp._stations = pd.Index(["10637", "10635"])
+    chunk = _process_chunk(temp, df, data.normalize()._plan[1:])
+
+    assert len(chunk.index) == 24
+    assert chunk.index.get_level_values("station").unique().tolist() == ["10637"]
+
+
+def test_fetch_view():
+    """
+    Test: Fetch a read-only view of the data
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._stations = pd.Index(["10637"])
+    data._data = pd.DataFrame(
+        {"temp": [1.0, np.NaN]},
+        index=pd.MultiIndex.from_tuples(
+            [
+                ("10637", pd.Timestamp("2022-01-01 00:00")),
+                ("10637", pd.Timestamp("2022-01-01 01:00")),
+            ],
+            names=["station", "time"],
+        ),
+    )
+
+    view = data.fetch(view=True)
+
+    assert np.shares_memory(view["temp"].to_numpy(), data._data["temp"].to_numpy())
+    with pytest.raises(ValueError):
+        view.fillna(0.0, inplace=True)
+    assert data.fetch().fillna(0.0)["temp"].tolist() == [1.0, 0.0]
+
+
+def test_normalize_duplicates():
+    """
+    Test: Merge duplicate rows when completing the time series
+    """
+
+    data = Hourly.__new__(Hourly)
+    data._set_time(datetime(2022, 1, 1), datetime(2022, 1, 1, 3))
+    data._stations = pd.Index(["10637"])
+    data._data = pd.DataFrame(
+        {"temp": [1.0, np.NaN, 3.0], "rhum": [np.NaN, 80.0, np.NaN]},
+        index=pd.MultiIndex.from_arrays(
+            [
+                ["10637"] * 3,
+                pd.to_datetime(["2022-01-01 00:00"] * 2 + ["2022-01-01 02:00"]),
+            ],
+            names=["station", "time"],
+        ),
+    )
+
+    df = data.normalize()._data
+
+    assert len(df.index) == 4
+    assert df["temp"].iloc[[0, 2]].tolist() == [1.0, 3.0]
+    assert df["rhum"].iloc[0] == 80.0
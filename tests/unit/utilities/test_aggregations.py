@@ -0,0 +1,77 @@
+"""
+Aggregation Utility Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+from meteostat.utilities.aggregations import aggregate_groups, coalesce, degree_mean
+
+
+def test_coalesce():
+    """
+    Coalesce values by station priority
+    """
+
+    df = pd.DataFrame(
+        {
+            "station": ["10637", "10637", "10635", "10635"],
+            "time": pd.to_datetime(["2022-01-01", "2022-01-02"] * 2),
+            "temp": [1.0, np.NaN, 3.0, 4.0],
+        }
+    ).set_index(["station", "time"])
+
+    result = coalesce(df, pd.Index(["10637", "10635"]))
+
+    assert result["temp"].tolist() == [1.0, 4.0]
+
+
+def test_coalesce_priority():
+    """
+    Coalesce values by station priority II
+    """
+
+    df = pd.DataFrame(
+        {
+            "station": ["10637", "10635"],
+            "time": pd.to_datetime(["2022-01-01"] * 2),
+            "temp": [1.0, 3.0],
+        }
+    ).set_index(["station", "time"])
+
+    result = coalesce(df, pd.Index(["10635", "10637"]))
+
+    assert result["temp"].tolist() == [3.0]
+
+
+def test_aggregate_groups():
+    """
+    Aggregate wind direction using the circular mean
+    """
+
+    df = pd.DataFrame(
+        {
+            "station": ["10637"] * 3,
+            "time": pd.to_datetime(
+                ["2022-01-01 00:00", "2022-01-01 12:00", "2022-01-02 00:00"]
+            ),
+            "temp": [1.0, 3.0, np.NaN],
+            "wdir": [350.0, 10.0, np.NaN],
+        }
+    ).set_index(["station", "time"])
+
+    result = aggregate_groups(
+        df,
+        ["station", pd.Grouper(level="time", freq="1D")],
+        {"wdir": degree_mean, "temp": "mean"},
+    )
+
+    assert result.columns.tolist() == ["wdir", "temp"]
+    assert result["temp"].iloc[0] == 2.0
+    assert round(result["wdir"].iloc[0]) % 360 == 0
+    assert np.isnan(result["wdir"].iloc[1])
@@ -0,0 +1,193 @@
+"""
+Mutation Utility Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from datetime import datetime
+import pytest
+import numpy as np
+import pandas as pd
+from meteostat import units
+from meteostat.utilities.mutations import (
+    adjust_temp,
+    filter_time,
+    localize,
+    convert_units,
+    interpolate_blocks,
+    read_only,
+    sparsify,
+    densify,
+)
+
+
+def get_data() -> pd.DataFrame:
+    """
+    Create a DataFrame with two weather stations
+    """
+
+    return pd.DataFrame(
+        {
+            "station": ["10637", "10635"],
+            "time": pd.to_datetime(["2022-01-01", "2022-07-01"]),
+            "temp": [10.0, np.NaN],
+            "pres": [1013.25, 1000.0],
+            "elevation": [200.0, 300.0],
+        }
+    ).set_index(["station", "time"])
+
+
+def test_filter_time():
+    """
+    Filter sorted & unsorted time series with open-ended ranges
+    """
+
+    df = get_data()
+
+    assert len(filter_time(df, datetime(2022, 3, 1))) == 1
+    assert len(filter_time(df, end=datetime(2022, 3, 1))) == 1
+    assert len(filter_time(df.iloc[::-1], datetime(2022, 3, 1))) == 1
+    assert len(filter_time(df)) == 2
+
+
+def test_adjust_temp():
+    """
+    Adjust temperature based on altitude
+    """
+
+    df = adjust_temp(get_data(), 100)
+
+    assert df["temp"].iloc[0] == 10.6
+    assert np.isnan(df["temp"].iloc[1])
+
+
+def test_adjust_temp_seasonal():
+    """
+    Adjust temperature based on seasonal lapse rates
+    """
+
+    df = get_data()
+    df["temp"] = 10.0
+    df = adjust_temp(df, 100, {"temp": [0.5] * 6 + [1.0] * 6})
+
+    assert df["temp"].tolist() == [10.5, 12.0]
+
+
+def test_adjust_pres():
+    """
+    Reduce sea-level pressure to the target altitude
+    """
+
+    df = adjust_temp(get_data(), 1000, adjust_pres=True)
+
+    assert round(df["pres"].iloc[0]) == 899
+
+
+def test_interpolate_blocks():
+    """
+    Interpolate values without crossing block boundaries
+    """
+
+    values = np.array([[1.0], [np.NaN], [3.0], [np.NaN], [np.NaN], [6.0]])
+    groups = np.array([0, 0, 0, 0, 1, 1])
+
+    result = interpolate_blocks(values, groups, np.arange(6.0), limit=1)
+
+    assert result[:, 0].tolist() == [1.0, 2.0, 3.0, 3.0, 6.0, 6.0]
+
+
+def test_convert_units():
+    """
+    Convert columns using vectorized & custom units
+    """
+
+    df = get_data()
+    df["wdir"] = [10.0, 200.0]
+
+    result = convert_units(
+        df,
+        {"temp": units.fahrenheit, "wdir": units.direction, "pres": lambda x: x - 1},
+    )
+
+    assert result["temp"].iloc[0] == 50.0
+    assert result["wdir"].tolist() == ["N", "S"]
+    assert result["pres"].tolist() == [1012.25, 999.0]
+    assert df["temp"].iloc[0] == 10.0
+
+
+def test_sparsify():
+    """
+    Store mostly empty columns as sparse arrays
+    """
+
+    df = get_data()
+    df["snow"] = [np.NaN, np.NaN]
+
+    result = sparsify(df, 0.1)
+
+    assert isinstance(result["snow"].dtype, pd.SparseDtype)
+    assert result["temp"].dtype == "float64"
+    assert df["snow"].dtype == "float64"
+    assert densify(result)["snow"].dtype == "float64"
+
+    # Always use sparse arrays for the given columns
+    result = sparsify(df, None, ("temp",))
+
+    assert isinstance(result["temp"].dtype, pd.SparseDtype)
+    assert result["snow"].dtype == "float64"
+
+
+def test_localize():
+    """
+    Convert UTC time data to the local time of each weather station
+    """
+
+    df = get_data()
+
+    result = localize(
+        df, pd.Series({"10637": "Europe/Berlin", "10635": "America/New_York"})
+    )
+
+    assert result.index.get_level_values("time").tolist() == [
+        pd.Timestamp("2022-01-01 01:00"),
+        pd.Timestamp("2022-06-30 20:00"),
+    ]
+
+
+def test_localize_dst():
+    """
+    Drop the repeated local hour at the end of daylight saving time
+    """
+
+    df = pd.DataFrame(
+        {"temp": [1.0, 2.0]},
+        index=pd.MultiIndex.from_arrays(
+            [["10637"] * 2, pd.to_datetime(["2022-10-30 00:00", "2022-10-30 01:00"])],
+            names=["station", "time"],
+        ),
+    )
+
+    with pytest.warns(Warning):
+        result = localize(df, pd.Series({"10637": "Europe/Berlin"}))
+
+    assert result["temp"].tolist() == [1.0]
+
+
+def test_read_only():
+    """
+    Create a read-only view of a DataFrame
+    """
+
+    df = get_data()
+    view = read_only(df)
+
+    assert np.shares_memory(view["temp"].to_numpy(), df["temp"].to_numpy())
+    with pytest.raises(ValueError):
+        view.iloc[0, 0] = 0.0
+    with pytest.raises(ValueError):
+        view.fillna(0.0, inplace=True)
+    assert view.copy().fillna(0.0)["temp"].tolist() == [10.0, 0.0]